@@ -13,6 +13,7 @@ if str(REPO_ROOT) not in sys.path:
 
 from apps.orchestrator.ta_roles.dataset_paths import resolve_dataset_root
 from ccopilot.cli.run_poc import main as _cli_main
+from ccopilot.utils.paths import resolve_optional, resolve_path
 
 DEFAULT_CONFIG_REL = Path("config") / "pipeline.yaml"
 DEFAULT_CONSTRAINTS_REL = Path("config") / "course_config.yaml"
@@ -64,24 +65,8 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _resolve_path(value: str | Path, *, base: Path | None = None) -> Path:
-    """Return an absolute path, anchoring relatives to ``base`` when provided."""
-
-    candidate = Path(value).expanduser()
-    if candidate.is_absolute():
-        return candidate.resolve()
-    anchor = Path(base).expanduser().resolve() if base is not None else Path.cwd()
-    return (anchor / candidate).resolve()
-
-
-def _resolve_optional_path(value: str | Path | None, *, base: Path | None = None) -> Path | None:
-    if value is None:
-        return None
-    return _resolve_path(value, base=base)
-
-
 def _resolve_dataset_path(args: argparse.Namespace, repo_root: Path) -> Path | None:
-    explicit = _resolve_optional_path(args.concepts, base=repo_root)
+    explicit = resolve_optional(args.concepts, base=repo_root)
     if explicit is not None:
         return explicit
 
@@ -93,13 +78,13 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    repo_root = _resolve_path(args.repo_root)
+    repo_root = resolve_path(args.repo_root)
     config_path = (repo_root / DEFAULT_CONFIG_REL).resolve()
     constraints_default = (repo_root / DEFAULT_CONSTRAINTS_REL).resolve()
     science_default = (repo_root / DEFAULT_SCIENCE_CONFIG_REL).resolve()
     dataset_path = _resolve_dataset_path(args, repo_root)
 
-    constraints_path = _resolve_optional_path(args.constraints, base=repo_root)
+    constraints_path = resolve_optional(args.constraints, base=repo_root)
     if constraints_path is None and constraints_default.exists():
         constraints_path = constraints_default
 
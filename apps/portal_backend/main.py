@@ -1,21 +1,74 @@
 from __future__ import annotations
 
 import copy
-import json
+import hashlib
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from functools import lru_cache
+from email.utils import formatdate, parsedate_to_datetime
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any, Dict, List
+from stat import S_ISREG
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Mapping, Tuple
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+import anyio.to_thread
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
+from pydantic import BaseModel, Field, PrivateAttr
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
-RUN_PATTERN = re.compile(r"run-(?P<run_id>[0-9]{8}-[0-9]{6})-manifest\.json$")
+RUN_PATTERN = re.compile(r"run-(?P<run_id>[0-9]{8}-[0-9]{6})-manifest\.json$", re.ASCII)
+_RUN_PREFIX = "run-"
+_MANIFEST_SUFFIX = "-manifest.json"
+_RUN_NAME_LENGTH = len("run-YYYYMMDD-HHMMSS-manifest.json")
+_TRACE_SLUG_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
+_TEXT_MEDIA_TYPE = "text/plain; charset=utf-8"
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+_UTC = timezone.utc
+_NUMERIC_TYPES = (int, float)
+_STR_LIST_TYPES = (str, int, float)
+# Manifest fields consumed by the /runs listing. Heavy subtrees such as
+# notebook_exports or evaluation attempts are only needed by the detail view.
+_LIST_MANIFEST_KEYS = (
+    "course_plan",
+    "lecture",
+    "eval_report",
+    "notebook_export_summary",
+    "ablations",
+    "highlight_source",
+    "world_model_store",
+    "world_model_store_exists",
+    "world_model_highlights",
+    "scientific_metrics",
+    "scientific_metrics_artifact",
+    "science_config_path",
+    "teacher_rlm",
+)
+_LIST_EVALUATION_KEYS = ("overall_score", "rubric_engine", "quiz_engine")
+_MANIFEST_CACHE_SIZE = 256
+_LIST_MAX_WORKERS = 16
+_LIST_EXECUTOR: ThreadPoolExecutor | None = None
+_LIST_EXECUTOR_LOCK = threading.Lock()
+# Manifests rewritten in place do not bump the directory mtime, so cached listings also expire.
+_RUNS_CACHE_TTL_SECONDS = 2.0
+# Row fields that depend on files other than the manifest; recomputed on every listing build.
+_ROW_LIVE_FIELDS = frozenset({"has_course_plan", "has_lecture", "has_eval_report", "highlight_source", "world_model_store_exists"})
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (bytes in, bytes out)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 class PortalSettings(BaseModel):
@@ -24,20 +77,35 @@ class PortalSettings(BaseModel):
     repo_root: Path = Field(default=REPO_ROOT)
     outputs_dir: Path = Field(default=REPO_ROOT / "outputs")
     notebook_slug: str | None = Field(default=os.getenv("OPEN_NOTEBOOK_SLUG"))
+    threadpool_size: int = Field(default=128, ge=1)
+
+    _outputs_root: Path = PrivateAttr()
+    _artifacts_dir: Path = PrivateAttr()
+    _repo_root: Path = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        # Settings are immutable for the process lifetime, so resolve the roots once.
+        self._outputs_root = self.outputs_dir.resolve()
+        self._artifacts_dir = (self.outputs_dir / "artifacts").resolve()
+        self._repo_root = self.repo_root.resolve()
+
+    @property
+    def outputs_root(self) -> Path:
+        return self._outputs_root
+
+    @property
+    def resolved_repo_root(self) -> Path:
+        return self._repo_root
 
     @property
     def artifacts_dir(self) -> Path:
-        return (self.outputs_dir / "artifacts").resolve()
+        return self._artifacts_dir
 
     def resolve_path(self, maybe_relative: str | None) -> Path | None:
         if not maybe_relative:
             return None
-        outputs_root = self.outputs_dir.resolve()
-        candidate = Path(maybe_relative)
-        if not candidate.is_absolute():
-            candidate = (outputs_root / candidate).resolve()
-        else:
-            candidate = candidate.resolve()
+        outputs_root = self._outputs_root
+        candidate = _resolve_under(outputs_root, maybe_relative)
 
         try:
             candidate.relative_to(outputs_root)
@@ -49,16 +117,49 @@ class PortalSettings(BaseModel):
         return candidate
 
 
-@lru_cache
-def get_settings() -> PortalSettings:
+def _resolve_under(root: Path, raw: str) -> Path:
+    """``realpath`` of a manifest path (relative entries are anchored at the pre-resolved ``root``).
+
+    A purely lexical normpath check would let symlinks inside outputs/ escape the sandbox, and
+    a memoized result would miss a component swapped for a symlink later, so every candidate
+    is resolved afresh.
+    """
+
+    candidate = Path(raw)
+    if not candidate.is_absolute():
+        candidate = root / candidate
+    return candidate.resolve()
+
+
+def _build_settings() -> PortalSettings:
     outputs_dir = os.getenv("PORTAL_OUTPUTS_DIR")
     notebook_slug = os.getenv("PORTAL_NOTEBOOK_SLUG") or os.getenv("OPEN_NOTEBOOK_SLUG")
+    threadpool_size = os.getenv("PORTAL_THREADPOOL_SIZE")
+    extra: Dict[str, Any] = {}
+    if threadpool_size:
+        try:
+            size = int(threadpool_size)
+        except ValueError:
+            size = 0
+        if size < 1:
+            raise RuntimeError(f"PORTAL_THREADPOOL_SIZE must be a positive integer, got {threadpool_size!r}")
+        extra["threadpool_size"] = size
     return PortalSettings(
         outputs_dir=Path(outputs_dir).expanduser().resolve() if outputs_dir else REPO_ROOT / "outputs",
         notebook_slug=notebook_slug,
+        **extra,
     )
 
 
+SETTINGS = _build_settings()
+
+
+def get_settings() -> PortalSettings:
+    """Return the process-wide settings; tests swap them via ``app.dependency_overrides``."""
+
+    return SETTINGS
+
+
 class RunListItem(BaseModel):
     run_id: str
     manifest_path: str
@@ -143,7 +244,21 @@ class HealthResponse(BaseModel):
     latest_run_id: str | None = None
 
 
-app = FastAPI(title="CourseGen Portal API", version="0.1.0")
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Endpoints are sync and run on AnyIO's worker threads (40 by default). They only
+    # block on small file reads, so the default cap of 128 lets more of them overlap under
+    # concurrent polling; PORTAL_THREADPOOL_SIZE sets the cap either way.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = SETTINGS.threadpool_size
+    yield
+
+
+app = FastAPI(
+    title="CourseGen Portal API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -153,35 +268,71 @@ app.add_middleware(
 )
 
 
+RunContext = Tuple[Path, Dict[str, Any]]
+
+
+def run_context(run_id: str, settings: PortalSettings = Depends(get_settings)) -> RunContext:
+    """Resolve and parse a run's manifest once per request (FastAPI caches dependency results)."""
+
+    manifest_path = _find_manifest_path(run_id, settings)
+    return manifest_path, _load_manifest(manifest_path)
+
+
 @app.get("/health", response_model=HealthResponse)
 def health(settings: PortalSettings = Depends(get_settings)) -> HealthResponse:
-    manifest_paths = _iter_manifest_paths(settings)
-    latest = _extract_run_id(manifest_paths[0]) if manifest_paths else None
+    latest: str | None = None
+    for manifest_path in _manifest_paths_newest_first(settings):
+        try:
+            _load_manifest(manifest_path)
+        except (ValueError, HTTPException):
+            continue
+        latest = _extract_run_id(manifest_path)
+        break
     return HealthResponse(status="ok", latest_run_id=latest)
 
 
 @app.get("/runs", response_model=List[RunListItem])
 def list_runs(
+    request: Request,
+    response: Response,
     limit: int = Query(50, ge=1, le=500, description="Maximum runs to return"),
     offset: int = Query(0, ge=0, description="Number of runs to skip before listing"),
     settings: PortalSettings = Depends(get_settings),
-) -> List[RunListItem]:
-    return _list_runs(settings, limit=limit, offset=offset)
+) -> List[RunListItem] | Response:
+    rows, etag = _listing_page(settings, _run_listing(settings), limit=limit, offset=offset)
+    if _etag_matches(request, etag):
+        return _not_modified({"ETag": etag})
+    response.headers["ETag"] = etag
+    return rows
 
 
 @app.get("/runs/latest", response_model=RunDetail)
-def get_latest_run(settings: PortalSettings = Depends(get_settings)) -> RunDetail:
-    runs = _list_runs(settings, limit=1)
-    if not runs:
-        raise HTTPException(status_code=404, detail="No runs captured yet")
-    latest = runs[0]
-    return get_run_detail(latest.run_id, settings)
+def get_latest_run(
+    request: Request,
+    response: Response,
+    settings: PortalSettings = Depends(get_settings),
+) -> RunDetail | Response:
+    # A half-written or corrupt newest manifest should not hide the previous good run.
+    for manifest_path in _manifest_paths_newest_first(settings):
+        try:
+            return get_run_detail(_extract_run_id(manifest_path), request, response, settings)
+        except ValueError:
+            continue
+        except HTTPException as exc:
+            if exc.status_code != 404:
+                raise
+    raise HTTPException(status_code=404, detail="No runs captured yet")
 
 
 @app.get("/runs/{run_id}", response_model=RunDetail)
-def get_run_detail(run_id: str, settings: PortalSettings = Depends(get_settings)) -> RunDetail:
+def get_run_detail(
+    run_id: str,
+    request: Request,
+    response: Response,
+    settings: PortalSettings = Depends(get_settings),
+) -> RunDetail | Response:
     manifest_path = _find_manifest_path(run_id, settings)
-    manifest = _load_manifest(manifest_path)
+    manifest, created_at = _load_manifest_entry(manifest_path)
     course_plan_path = _safe_resolve(settings, manifest.get("course_plan"))
     lecture_path = _safe_resolve(settings, manifest.get("lecture"))
     trace_files = collect_trace_files(run_id, manifest, settings)
@@ -200,10 +351,12 @@ def get_run_detail(run_id: str, settings: PortalSettings = Depends(get_settings)
     science_artifact_rel = sanitized_manifest.get("scientific_metrics_artifact")
     teacher_rlm = manifest.get("teacher_rlm") if isinstance(manifest.get("teacher_rlm"), dict) else None
 
-    return RunDetail(
+    # Nested models are built with model_construct; FastAPI validates the whole payload
+    # once against response_model=RunDetail on the way out.
+    detail = RunDetail.model_construct(
         run_id=run_id,
         manifest_path=_relative_to_outputs(settings, manifest_path),
-        created_at=_timestamp_for(manifest_path),
+        created_at=created_at,
         manifest=sanitized_manifest,
         dataset_summary=manifest.get("dataset_summary"),
         ablations=manifest.get("ablations"),
@@ -222,145 +375,474 @@ def get_run_detail(run_id: str, settings: PortalSettings = Depends(get_settings)
         scientific_metrics_artifact=science_artifact_rel,
         science_config_path=sanitized_manifest.get("science_config_path"),
     )
+    # Excerpts, trace listings and store existence come from files the manifest stat does not
+    # cover (course_plan.md and lectures/ are rewritten by every run), so hash the payload.
+    validators = {
+        "ETag": _payload_etag(detail.model_dump(mode="json", warnings=False)),
+        "Cache-Control": "private, must-revalidate",
+    }
+    if _etag_matches(request, validators["ETag"]):
+        return _not_modified(validators)
+    response.headers.update(validators)
+    return detail
 
 
 @app.get("/runs/{run_id}/course-plan", response_class=PlainTextResponse)
-def get_course_plan(run_id: str, settings: PortalSettings = Depends(get_settings)) -> str:
-    manifest_path = _find_manifest_path(run_id, settings)
-    manifest = _load_manifest(manifest_path)
+def get_course_plan(
+    request: Request,
+    run: RunContext = Depends(run_context),
+    settings: PortalSettings = Depends(get_settings),
+) -> Response:
+    _, manifest = run
     course_plan_path = settings.resolve_path(manifest.get("course_plan"))
-    if not course_plan_path or not course_plan_path.exists():
-        raise HTTPException(status_code=404, detail="Course plan not found for this run")
-    return course_plan_path.read_text(encoding="utf-8")
+    return _plain_text_response(request, course_plan_path, missing_detail="Course plan not found for this run")
 
 
 @app.get("/runs/{run_id}/lecture", response_class=PlainTextResponse)
-def get_lecture(run_id: str, settings: PortalSettings = Depends(get_settings)) -> str:
-    manifest_path = _find_manifest_path(run_id, settings)
-    manifest = _load_manifest(manifest_path)
+def get_lecture(
+    request: Request,
+    run: RunContext = Depends(run_context),
+    settings: PortalSettings = Depends(get_settings),
+) -> Response:
+    _, manifest = run
     lecture_path = settings.resolve_path(manifest.get("lecture"))
-    if not lecture_path or not lecture_path.exists():
-        raise HTTPException(status_code=404, detail="Lecture artifact not found for this run")
-    return lecture_path.read_text(encoding="utf-8")
+    return _plain_text_response(request, lecture_path, missing_detail="Lecture artifact not found for this run")
 
 
 @app.get("/runs/{run_id}/science-metrics")
-def get_science_metrics(run_id: str, settings: PortalSettings = Depends(get_settings)) -> Dict[str, Any]:
-    manifest_path = _find_manifest_path(run_id, settings)
-    manifest = _load_manifest(manifest_path)
+def get_science_metrics(
+    run: RunContext = Depends(run_context),
+    settings: PortalSettings = Depends(get_settings),
+) -> Dict[str, Any]:
+    _, manifest = run
     science_path = settings.resolve_path(manifest.get("scientific_metrics_artifact"))
     if not science_path or not science_path.exists():
         raise HTTPException(status_code=404, detail="Scientific metrics artifact not found for this run")
     try:
-        return json.loads(science_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+        return orjson.loads(science_path.read_bytes())
+    except orjson.JSONDecodeError as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=500, detail="Scientific metrics artifact is not valid JSON") from exc
 
 
 @app.get("/runs/{run_id}/notebook-exports", response_model=List[NotebookExport])
-def get_notebook_exports(run_id: str, settings: PortalSettings = Depends(get_settings)) -> List[NotebookExport]:
-    manifest_path = _find_manifest_path(run_id, settings)
-    manifest = _load_manifest(manifest_path)
+def get_notebook_exports(
+    run: RunContext = Depends(run_context),
+    settings: PortalSettings = Depends(get_settings),
+) -> List[NotebookExport]:
+    _, manifest = run
     return _parse_notebook_exports(manifest, settings)
 
 
 @app.get("/runs/{run_id}/traces/{trace_name}", response_class=PlainTextResponse)
-def get_trace_file(run_id: str, trace_name: str, settings: PortalSettings = Depends(get_settings)) -> str:
-    manifest_path = _find_manifest_path(run_id, settings)
-    manifest = _load_manifest(manifest_path)
+def get_trace_file(
+    run_id: str,
+    trace_name: str,
+    request: Request,
+    run: RunContext = Depends(run_context),
+    settings: PortalSettings = Depends(get_settings),
+) -> Response:
+    _, manifest = run
     trace_files = collect_trace_files(run_id, manifest, settings)
     for trace in trace_files:
         if trace.name == trace_name:
             trace_path = settings.resolve_path(trace.path)
-            if not trace_path or not trace_path.exists():
-                raise HTTPException(status_code=404, detail=f"Trace file missing at {trace.path}")
-            return trace_path.read_text(encoding="utf-8")
+            return _plain_text_response(request, trace_path, missing_detail=f"Trace file missing at {trace.path}")
     raise HTTPException(status_code=404, detail=f"Trace '{trace_name}' not found for run {run_id}")
 
 
-def _list_runs(settings: PortalSettings, *, limit: int | None = None, offset: int = 0) -> List[RunListItem]:
-    items: List[RunListItem] = []
-    manifest_paths = _iter_manifest_paths(settings)
+def _plain_text_response(request: Request, path: Path | None, *, missing_detail: str) -> Response:
+    """Stream an artifact as UTF-8 text, or answer 304 when the client copy is current."""
+
+    if not path:
+        raise HTTPException(status_code=404, detail=missing_detail)
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=missing_detail) from exc
+    if not S_ISREG(stat.st_mode):
+        raise HTTPException(status_code=404, detail=missing_detail)
+    validators = _validator_headers(stat)
+    if _is_not_modified(request, validators, stat):
+        return _not_modified(validators)
+    # FileResponse streams in chunks (or hands the path to the server via pathsend) instead of
+    # materialising large lectures/traces in memory.
+    return FileResponse(path, headers=validators, media_type=_TEXT_MEDIA_TYPE, stat_result=stat)
+
+
+@dataclass(slots=True, frozen=True)
+class _RunListing:
+    dir_mtime_ns: int
+    expires_at: float
+    manifests: List[Tuple[Path, os.stat_result]]
+    # (offset, limit) -> (rows, etag); only pages that were actually requested get built.
+    pages: Dict[Tuple[int, int], Tuple[List[RunListItem], str]] = field(default_factory=dict)
+
+
+_runs_cache: Dict[str, _RunListing] = {}
+_runs_cache_lock = threading.Lock()
+_RUNS_CACHE_MAX_PAGES = 32
+
+
+def _run_listing(settings: PortalSettings) -> _RunListing:
+    """Return the sorted manifest scan, rescanned only when the artifacts dir changes or the TTL lapses."""
+
+    artifacts_dir = settings.artifacts_dir
+    try:
+        dir_mtime = artifacts_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        dir_mtime = 0
+    key = str(artifacts_dir)
+    now = time.monotonic()
+    with _runs_cache_lock:
+        cached = _runs_cache.get(key)
+    if cached is not None and cached.dir_mtime_ns == dir_mtime and now < cached.expires_at:
+        return cached
+
+    listing = _RunListing(
+        dir_mtime_ns=dir_mtime,
+        expires_at=now + _RUNS_CACHE_TTL_SECONDS,
+        manifests=_scan_manifests(settings),
+    )
+    with _runs_cache_lock:
+        _runs_cache[key] = listing
+    return listing
+
+
+def _listing_page(
+    settings: PortalSettings,
+    listing: _RunListing,
+    *,
+    limit: int,
+    offset: int,
+) -> Tuple[List[RunListItem], str]:
+    """Build (once per listing) the rows and ETag for one page instead of every run in the directory."""
+
+    page_key = (offset, limit)
+    with _runs_cache_lock:
+        page = listing.pages.get(page_key)
+    if page is not None:
+        return page
+    rows = _list_runs(settings, limit=limit, offset=offset, manifests=listing.manifests)
+    # Hash what the client actually receives so artifact/store existence flips change the ETag too.
+    page = (rows, _payload_etag([row.model_dump(mode="json") for row in rows]))
+    with _runs_cache_lock:
+        if len(listing.pages) >= _RUNS_CACHE_MAX_PAGES:
+            listing.pages.clear()
+        listing.pages[page_key] = page
+    return page
+
+
+def _list_runs(
+    settings: PortalSettings,
+    *,
+    limit: int | None = None,
+    offset: int = 0,
+    manifests: List[Tuple[Path, os.stat_result]] | None = None,
+) -> List[RunListItem]:
+    if manifests is None:
+        manifests = _scan_manifests(settings)
     if offset:
-        manifest_paths = manifest_paths[offset:]
+        manifests = manifests[offset:]
     if limit is not None:
-        manifest_paths = manifest_paths[:limit]
-
-    for manifest_path in manifest_paths:
+        manifests = manifests[:limit]
+
+    if len(manifests) > 1:
+        # Each row costs a manifest read plus up to three artifact stats; overlap them.
+        rows = list(_list_executor().map(lambda entry: _build_run_list_item(settings, *entry), manifests))
+    else:
+        rows = [_build_run_list_item(settings, *entry) for entry in manifests]
+    return [row for row in rows if row is not None]
+
+
+def _list_executor() -> ThreadPoolExecutor:
+    global _LIST_EXECUTOR
+    if _LIST_EXECUTOR is None:
+        with _LIST_EXECUTOR_LOCK:
+            if _LIST_EXECUTOR is None:
+                _LIST_EXECUTOR = ThreadPoolExecutor(max_workers=_LIST_MAX_WORKERS, thread_name_prefix="portal-runs")
+    return _LIST_EXECUTOR
+
+
+# Validated listing fields per manifest, keyed like the manifest cache. Artifact and world-model
+# store existence are re-checked on every build because those files can appear or disappear
+# without touching the manifest.
+_RunRowEntry = Tuple[Tuple[int, int], Dict[str, Any], Tuple[Path | None, ...], Dict[str, Any]]
+_run_row_cache: "OrderedDict[Tuple[str, str, str], _RunRowEntry]" = OrderedDict()
+_run_row_cache_lock = threading.Lock()
+
+
+def _build_run_list_item(settings: PortalSettings, manifest_path: Path, stat: os.stat_result) -> RunListItem | None:
+    key = (str(manifest_path), str(settings.outputs_root), str(settings.resolved_repo_root))
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _run_row_cache_lock:
+        cached = _run_row_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _run_row_cache.move_to_end(key)
+    if cached is not None and cached[0] == signature:
+        _, fields, artifacts, manifest = cached
+    else:
         try:
-            manifest = _load_manifest(manifest_path)
+            fields, artifacts, manifest = _run_list_fields(settings, manifest_path, stat)
         except ValueError:
-            continue
-        run_id = _extract_run_id(manifest_path)
-        course_plan = _safe_resolve(settings, manifest.get("course_plan"))
-        lecture = _safe_resolve(settings, manifest.get("lecture"))
-        eval_report = _safe_resolve(settings, manifest.get("eval_report"))
-        evaluation = manifest.get("evaluation") or {}
-        rubric_engine = _safe_str(evaluation.get("rubric_engine"))
-        quiz_engine = _safe_str(evaluation.get("quiz_engine"))
-        notebook_summary = manifest.get("notebook_export_summary")
-        store_exists = _derive_world_model_store_exists(manifest, settings)
-        highlight_source = _derive_highlight_source(manifest, settings, store_exists=store_exists)
-        science_artifact = _relative_manifest_path(settings, manifest.get("scientific_metrics_artifact"))
-        science_config_rel = _relative_manifest_path(settings, manifest.get("science_config_path"))
-        teacher_rlm = manifest.get("teacher_rlm") if isinstance(manifest.get("teacher_rlm"), dict) else None
-
-        items.append(
-            RunListItem(
-                run_id=run_id,
-                manifest_path=_relative_to_outputs(settings, manifest_path),
-                created_at=_timestamp_for(manifest_path),
-                has_course_plan=bool(course_plan and course_plan.exists()),
-                has_lecture=bool(lecture and lecture.exists()),
-                has_eval_report=bool(eval_report and eval_report.exists()),
-                overall_score=evaluation.get("overall_score"),
-                rubric_engine=rubric_engine,
-                quiz_engine=quiz_engine,
-                notebook_export_summary=notebook_summary if isinstance(notebook_summary, dict) else None,
-                highlight_source=highlight_source,
-                world_model_store_exists=store_exists,
-                scientific_metrics=manifest.get("scientific_metrics"),
-                scientific_metrics_artifact=science_artifact,
-                ablations=manifest.get("ablations") if isinstance(manifest.get("ablations"), dict) else None,
-                science_config_path=science_config_rel,
-                teacher_rlm=teacher_rlm,
-            )
-        )
-    return items
+            return None
+        with _run_row_cache_lock:
+            _run_row_cache[key] = (signature, fields, artifacts, manifest)
+            _run_row_cache.move_to_end(key)
+            while len(_run_row_cache) > _MANIFEST_CACHE_SIZE:
+                _run_row_cache.popitem(last=False)
+
+    course_plan, lecture, eval_report = artifacts
+    store_exists = _derive_world_model_store_exists(manifest, settings)
+    # Fields were validated when the row was first built; skip re-validation on every poll.
+    return RunListItem.model_construct(
+        **fields,
+        highlight_source=_derive_highlight_source(manifest, settings, store_exists=store_exists),
+        world_model_store_exists=store_exists,
+        has_course_plan=bool(course_plan and course_plan.exists()),
+        has_lecture=bool(lecture and lecture.exists()),
+        has_eval_report=bool(eval_report and eval_report.exists()),
+    )
+
+
+def _run_list_fields(
+    settings: PortalSettings,
+    manifest_path: Path,
+    stat: os.stat_result,
+) -> Tuple[Dict[str, Any], Tuple[Path | None, ...], Dict[str, Any]]:
+    manifest, created_at = _load_manifest_list_fields(manifest_path, stat)
+    run_id = _extract_run_id(manifest_path)
+    course_plan = _safe_resolve(settings, manifest.get("course_plan"))
+    lecture = _safe_resolve(settings, manifest.get("lecture"))
+    eval_report = _safe_resolve(settings, manifest.get("eval_report"))
+    evaluation = manifest.get("evaluation") or {}
+    rubric_engine = _safe_str(evaluation.get("rubric_engine"))
+    quiz_engine = _safe_str(evaluation.get("quiz_engine"))
+    notebook_summary = manifest.get("notebook_export_summary")
+    store_exists = _derive_world_model_store_exists(manifest, settings)
+    highlight_source = _derive_highlight_source(manifest, settings, store_exists=store_exists)
+    science_artifact = _relative_manifest_path(settings, manifest.get("scientific_metrics_artifact"))
+    science_config_rel = _relative_manifest_path(settings, manifest.get("science_config_path"))
+    teacher_rlm = manifest.get("teacher_rlm") if isinstance(manifest.get("teacher_rlm"), dict) else None
+
+    validated = RunListItem(
+        run_id=run_id,
+        manifest_path=_relative_to_outputs(settings, manifest_path),
+        created_at=created_at,
+        has_course_plan=False,
+        has_lecture=False,
+        has_eval_report=False,
+        overall_score=evaluation.get("overall_score"),
+        rubric_engine=rubric_engine,
+        quiz_engine=quiz_engine,
+        notebook_export_summary=notebook_summary if isinstance(notebook_summary, dict) else None,
+        highlight_source=highlight_source,
+        world_model_store_exists=store_exists,
+        scientific_metrics=manifest.get("scientific_metrics"),
+        scientific_metrics_artifact=science_artifact,
+        ablations=manifest.get("ablations") if isinstance(manifest.get("ablations"), dict) else None,
+        science_config_path=science_config_rel,
+        teacher_rlm=teacher_rlm,
+    )
+    fields = validated.model_dump(exclude=_ROW_LIVE_FIELDS)
+    return fields, (course_plan, lecture, eval_report), manifest
 
 
 def _iter_manifest_paths(settings: PortalSettings) -> List[Path]:
-    artifacts_dir = settings.artifacts_dir
-    if not artifacts_dir.exists():
+    return [path for path, _ in _scan_manifests(settings)]
+
+
+def _manifest_paths_newest_first(settings: PortalSettings) -> List[Path]:
+    """Return run manifests newest first by name, without statting or loading any of them."""
+
+    found: List[Tuple[str, str]] = []
+    try:
+        with os.scandir(settings.artifacts_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(_RUN_PREFIX) and name.endswith(_MANIFEST_SUFFIX) and entry.is_file():
+                    found.append((name, entry.path))
+    except FileNotFoundError:
         return []
-    return sorted(artifacts_dir.glob("run-*-manifest.json"), reverse=True)
+    found.sort(key=itemgetter(0), reverse=True)
+    return [Path(path) for _, path in found]
 
 
-def _find_manifest_path(run_id: str, settings: PortalSettings) -> Path:
+def _scan_manifests(settings: PortalSettings) -> List[Tuple[Path, os.stat_result]]:
+    """Return ``(path, stat)`` for every run manifest, newest run first, from one ``scandir`` pass."""
+
+    found: List[Tuple[str, str, os.stat_result]] = []
+    try:
+        with os.scandir(settings.artifacts_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(_RUN_PREFIX) and name.endswith(_MANIFEST_SUFFIX)):
+                    continue
+                try:
+                    if entry.is_file():
+                        found.append((name, entry.path, entry.stat()))
+                except FileNotFoundError:
+                    continue
+    except FileNotFoundError:
+        return []
+    found.sort(key=itemgetter(0), reverse=True)
+    return [(Path(path), stat) for _, path, stat in found]
+
+
+# run_id -> manifest path per artifacts dir, rebuilt whenever the directory mtime changes.
+_manifest_index_cache: Dict[str, Tuple[int, Dict[str, Path]]] = {}
+_manifest_index_lock = threading.Lock()
+
+
+def _manifest_index(settings: PortalSettings, *, refresh: bool = False) -> Dict[str, Path]:
+    artifacts_dir = settings.artifacts_dir
+    try:
+        dir_mtime = artifacts_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    key = str(artifacts_dir)
+    if not refresh:
+        with _manifest_index_lock:
+            cached = _manifest_index_cache.get(key)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+    index: Dict[str, Path] = {}
     for manifest_path in _iter_manifest_paths(settings):
-        if _extract_run_id(manifest_path) == run_id:
-            return manifest_path
-    raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
+        index.setdefault(_extract_run_id(manifest_path), manifest_path)
+    with _manifest_index_lock:
+        _manifest_index_cache[key] = (dir_mtime, index)
+    return index
+
+
+def _find_manifest_path(run_id: str, settings: PortalSettings) -> Path:
+    manifest_path = _manifest_index(settings).get(run_id)
+    if manifest_path is None:
+        # Coarse directory mtimes can hide a manifest written within the same tick; rescan once before 404.
+        manifest_path = _manifest_index(settings, refresh=True).get(run_id)
+    if manifest_path is None:
+        raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
+    return manifest_path
 
 
 def _extract_run_id(manifest_path: Path) -> str:
-    match = RUN_PATTERN.search(manifest_path.name)
+    name = manifest_path.name
+    # Fast path for the canonical run-YYYYMMDD-HHMMSS-manifest.json name; the regex handles the rest.
+    if len(name) == _RUN_NAME_LENGTH and name.startswith(_RUN_PREFIX) and name.endswith(_MANIFEST_SUFFIX):
+        run_id = name[len(_RUN_PREFIX) : -len(_MANIFEST_SUFFIX)]
+        digits = run_id[:8] + run_id[9:]
+        if run_id[8] == "-" and digits.isascii() and digits.isdigit():
+            return run_id
+    match = RUN_PATTERN.search(name)
     if not match:
         return manifest_path.stem
     return match.group("run_id")
 
 
+# Parsed manifests keyed by path; entries are reused while (mtime_ns, size) match.
+_manifest_cache: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any], datetime]]" = OrderedDict()
+_manifest_cache_lock = threading.Lock()
+
+
 def _load_manifest(path: Path) -> Dict[str, Any]:
+    return _load_manifest_entry(path)[0]
+
+
+def _load_manifest_entry(path: Path, stat: os.stat_result | None = None) -> Tuple[Dict[str, Any], datetime]:
+    """Return ``(manifest, created_at)`` using a single ``stat`` for the cache check and timestamp.
+
+    Pass the ``stat`` already collected by ``_scan_manifests`` to skip the syscall. Cached
+    manifests are shared between requests, so callers must treat them as read-only.
+    """
+
+    if stat is None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError as exc:
+            raise HTTPException(status_code=404, detail=f"Manifest missing at {path}") from exc
+    key = str(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _manifest_cache_lock:
+        cached = _manifest_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            _manifest_cache.move_to_end(key)
+            return cached[1], cached[2]
+
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        manifest = orjson.loads(path.read_bytes())
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=f"Manifest missing at {path}") from exc
-    except json.JSONDecodeError as exc:
+    except orjson.JSONDecodeError as exc:
         raise ValueError(f"Invalid manifest JSON: {path}") from exc
+    created_at = _timestamp_for(stat)
 
+    with _manifest_cache_lock:
+        _manifest_cache[key] = (signature, manifest, created_at)
+        _manifest_cache.move_to_end(key)
+        while len(_manifest_cache) > _MANIFEST_CACHE_SIZE:
+            _manifest_cache.popitem(last=False)
+    return manifest, created_at
 
-def _timestamp_for(path: Path) -> datetime:
-    return datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+
+def _timestamp_for(stat: os.stat_result) -> datetime:
+    """Return a manifest's mtime as an aware UTC datetime, reusing a stat the caller already holds."""
+
+    return datetime.fromtimestamp(stat.st_mtime, tz=_UTC)
+
+
+def _load_manifest_list_fields(path: Path, stat: os.stat_result | None = None) -> Tuple[Dict[str, Any], datetime]:
+    """Load a manifest and keep only the fields the run listing reads."""
+
+    manifest, created_at = _load_manifest_entry(path, stat)
+    fields = {key: manifest[key] for key in _LIST_MANIFEST_KEYS if key in manifest}
+    evaluation = manifest.get("evaluation")
+    if isinstance(evaluation, dict):
+        fields["evaluation"] = {key: evaluation[key] for key in _LIST_EVALUATION_KEYS if key in evaluation}
+    return fields, created_at
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def _not_modified(headers: Mapping[str, str]) -> Response:
+    return Response(status_code=304, headers=dict(headers))
+
+
+def _payload_etag(payload: Any) -> str:
+    """Strong ETag over the JSON a client receives."""
+
+    return f'"{hashlib.blake2b(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), digest_size=12).hexdigest()}"'
+
+
+def _validator_headers(stat: os.stat_result) -> Dict[str, str]:
+    return {
+        "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": "private, must-revalidate",
+    }
+
+
+def _is_not_modified(request: Request, validators: Mapping[str, str], stat: os.stat_result) -> bool:
+    # If-None-Match wins over If-Modified-Since when both are sent (RFC 9110 §13.2.2).
+    if request.headers.get("if-none-match"):
+        return _etag_matches(request, validators["ETag"])
+    since_header = request.headers.get("if-modified-since")
+    if not since_header:
+        return False
+    try:
+        since = parsedate_to_datetime(since_header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=_UTC)
+    # HTTP dates have one-second resolution.
+    return int(stat.st_mtime) <= since.timestamp()
 
 
 def collect_trace_files(run_id: str, manifest: Dict[str, Any], settings: PortalSettings) -> List[TraceFile]:
@@ -389,7 +871,7 @@ def collect_trace_files(run_id: str, manifest: Dict[str, Any], settings: PortalS
     for name, label, raw_path in candidates:
         resolved = _safe_resolve(settings, raw_path)
         if resolved and resolved.exists():
-            seen[name] = TraceFile(
+            seen[name] = TraceFile.model_construct(
                 name=name,
                 label=label,
                 path=_relative_to_outputs(settings, resolved),
@@ -397,17 +879,23 @@ def collect_trace_files(run_id: str, manifest: Dict[str, Any], settings: PortalS
 
     trace_dirs = [settings.outputs_dir / "traces", settings.outputs_dir / "logs"]
     for directory in trace_dirs:
-        if not directory.exists():
+        try:
+            with os.scandir(directory) as iterator:
+                # Plain substring match (like the old "*{run_id}*" glob, hidden files excluded).
+                entries = [entry for entry in iterator if run_id in entry.name and not entry.name.startswith(".")]
+        except (FileNotFoundError, NotADirectoryError):
             continue
-        for candidate in directory.glob(f"*{run_id}*"):
-            if not candidate.is_file():
+        entries.sort(key=attrgetter("name"))  # deterministic winner when two files map to one slug
+        for entry in entries:
+            if not entry.is_file():
                 continue
-            slug = re.sub(r"[^a-zA-Z0-9_-]", "_", candidate.stem.lower())
+            candidate = Path(entry.path)
+            slug = _TRACE_SLUG_PATTERN.sub("_", candidate.stem.lower())
             if slug not in seen:
-                seen[slug] = TraceFile(
+                seen[slug] = TraceFile.model_construct(
                     name=slug,
-                    label=candidate.name,
-                    path=_relative_to_outputs(settings, candidate.resolve()),
+                    label=entry.name,
+                    path=_relative_to_outputs(settings, candidate),
                 )
 
     return list(seen.values())
@@ -488,19 +976,21 @@ def _parse_notebook_exports(manifest: Dict[str, Any], settings: PortalSettings)
     results: List[NotebookExport] = []
     if not isinstance(entries, list):
         return results
+    append = results.append
+    outputs_root = settings.outputs_root
     for entry in entries:
         if not isinstance(entry, dict):
             continue
-        if str(entry.get("kind", "")).lower() == "preflight":
+        kind = entry.get("kind")
+        if kind is not None and str(kind).lower() == "preflight":
             continue
-        response = entry.get("response") if isinstance(entry.get("response"), dict) else None
-        citations = entry.get("citations") if isinstance(entry.get("citations"), list) else []
-        safe_citations = [str(cite) for cite in citations if isinstance(cite, (str, int, float))]
-        if response and response.get("export_path"):
-            response["export_path"] = _relative_manifest_path(settings, response["export_path"])
-        response_id = response.get("id") if response else None
-        note_id = response.get("note_id") if response else None
-        section_id = response.get("section_id") if response else None
+        response = entry.get("response")
+        if not isinstance(response, dict):
+            response = _EMPTY_MAPPING
+        get = response.get
+        response_id = get("id")
+        note_id = get("note_id")
+        section_id = get("section_id")
         if note_id is None:
             note_id = section_id or response_id
         if section_id is None:
@@ -509,20 +999,21 @@ def _parse_notebook_exports(manifest: Dict[str, Any], settings: PortalSettings)
         relative_path = None
         if resolved_path:
             try:
-                relative_path = resolved_path.relative_to(settings.outputs_dir.resolve())
+                relative_path = resolved_path.relative_to(outputs_root)
             except ValueError:
                 relative_path = Path(resolved_path.name)
-        results.append(
-            NotebookExport(
-                title=str(entry.get("title")) if entry.get("title") else None,
-                citations=safe_citations,
-                status=response.get("status") if response else None,
-                notebook=response.get("notebook") if response else None,
+        title = entry.get("title")
+        append(
+            NotebookExport.model_construct(
+                title=str(title) if title else None,
+                citations=_safe_str_list(entry.get("citations")),
+                status=get("status"),
+                notebook=get("notebook"),
                 note_id=note_id,
                 section_id=section_id,
                 path=str(relative_path) if relative_path else None,
-                reason=response.get("reason") if response else None,
-                error=response.get("error") if response else None,
+                reason=get("reason"),
+                error=get("error"),
             )
         )
     return results
@@ -545,17 +1036,17 @@ def _infer_notebook_slug(
 
 
 def _safe_score(overall_score: Any, rubrics_payload: Any) -> float | None:
-    if isinstance(overall_score, (int, float)):
+    if isinstance(overall_score, _NUMERIC_TYPES):
         return float(overall_score)
     if isinstance(rubrics_payload, dict):
         score = rubrics_payload.get("overall_score")
-        if isinstance(score, (int, float)):
+        if isinstance(score, _NUMERIC_TYPES):
             return float(score)
     return None
 
 
 def _safe_float(value: Any) -> float | None:
-    return float(value) if isinstance(value, (int, float)) else None
+    return float(value) if isinstance(value, _NUMERIC_TYPES) else None
 
 
 def _safe_str(value: Any) -> str | None:
@@ -567,7 +1058,15 @@ def _safe_str(value: Any) -> str | None:
 def _safe_str_list(value: Any) -> List[str]:
     if not isinstance(value, list):
         return []
-    return [str(item) for item in value if isinstance(item, (str, int, float))]
+    out: List[str] = []
+    append = out.append
+    for item in value:
+        # Most entries are already strings; skip the tuple isinstance check for them.
+        if item.__class__ is str:
+            append(item)
+        elif isinstance(item, _STR_LIST_TYPES):
+            append(str(item))
+    return out
 
 
 def _derive_world_model_store_exists(manifest: Dict[str, Any], settings: PortalSettings) -> bool | None:
@@ -637,6 +1136,7 @@ def _parse_evaluation_attempts(manifest: Dict[str, Any]) -> List[EvaluationAttem
         return []
 
     parsed: List[EvaluationAttempt] = []
+    append = parsed.append
     for entry in attempts:
         if not isinstance(entry, dict):
             continue
@@ -645,23 +1145,19 @@ def _parse_evaluation_attempts(manifest: Dict[str, Any]) -> List[EvaluationAttem
         if not isinstance(iteration, int):
             continue
 
-        rubrics_payload = entry.get("rubrics")
-        overall_score = _safe_score(entry.get("overall_score"), rubrics_payload)
+        overall_score = _safe_score(entry.get("overall_score"), entry.get("rubrics"))
 
-        quiz = entry.get("quiz") if isinstance(entry.get("quiz"), dict) else None
-        quiz_pass = _safe_float(quiz.get("pass_rate")) if quiz else None
+        quiz = entry.get("quiz")
+        quiz_pass = _safe_float(quiz.get("pass_rate")) if isinstance(quiz, dict) else None
 
-        mutation = entry.get("triggered_mutation") if isinstance(entry.get("triggered_mutation"), dict) else {}
-        failing_rubrics = mutation.get("failing_rubrics")
-        failing_questions = mutation.get("failing_questions")
+        mutation = entry.get("triggered_mutation")
+        if not isinstance(mutation, dict):
+            mutation = _EMPTY_MAPPING
+        failing_rubrics = mutation.get("failing_rubrics") or entry.get("failing_rubrics")
+        failing_questions = mutation.get("failing_questions") or entry.get("failing_questions")
 
-        if not failing_rubrics:
-            failing_rubrics = entry.get("failing_rubrics")
-        if not failing_questions:
-            failing_questions = entry.get("failing_questions")
-
-        parsed.append(
-            EvaluationAttempt(
+        append(
+            EvaluationAttempt.model_construct(
                 iteration=iteration,
                 overall_score=overall_score,
                 quiz_pass_rate=quiz_pass,
@@ -685,9 +1181,7 @@ def _relative_to_outputs(settings: PortalSettings, path: Path | None) -> str | N
     if not path:
         return None
     resolved = path.resolve()
-    outputs_root = settings.outputs_dir.resolve()
-    repo_root = settings.repo_root.resolve()
-    for base in (outputs_root, repo_root):
+    for base in (settings.outputs_root, settings.resolved_repo_root):
         try:
             return str(resolved.relative_to(base))
         except ValueError:
@@ -696,19 +1190,27 @@ def _relative_to_outputs(settings: PortalSettings, path: Path | None) -> str | N
 
 
 def _read_excerpt(path: Path | None, *, limit: int = 400) -> str | None:
-    if not path or not path.exists():
+    if not path:
+        return None
+    # UTF-8 needs at most 4 bytes per character, so this prefix always holds `limit` chars.
+    try:
+        with path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            raw = handle.read(limit * 4)
+    except (FileNotFoundError, IsADirectoryError):
         return None
-    text = path.read_text(encoding="utf-8")
+    text = raw.decode("utf-8", errors="ignore")
     snippet = text.strip().splitlines()
     preview = "\n".join(snippet[: min(8, len(snippet))])
-    if len(text) <= limit:
+    truncated = size > len(raw)
+    if not truncated and len(text) <= limit:
         return preview
     return preview[:limit].rstrip() + "…"
 
 
 @app.exception_handler(HTTPException)
-async def http_error_handler(_: Any, exc: HTTPException) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+async def http_error_handler(_: Any, exc: HTTPException) -> ORJSONResponse:
+    return ORJSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
 
 
 def build_teacher_trace_meta(manifest: Dict[str, Any], settings: PortalSettings) -> TeacherTraceMeta | None:
@@ -716,16 +1218,16 @@ def build_teacher_trace_meta(manifest: Dict[str, Any], settings: PortalSettings)
     if not trace_path or not trace_path.exists():
         return None
     try:
-        payload = json.loads(trace_path.read_text(encoding="utf-8"))
+        payload = orjson.loads(trace_path.read_bytes())
     except (ValueError, OSError):
-        return TeacherTraceMeta(path=str(trace_path))
+        return TeacherTraceMeta.model_construct(path=str(trace_path))
 
     actions = payload.get("actions") if isinstance(payload, dict) else []
     action_count = len(actions) if isinstance(actions, list) else 0
     summary = payload.get("summary") if isinstance(payload, dict) else None
     prompt = payload.get("prompt") if isinstance(payload, dict) else None
 
-    return TeacherTraceMeta(
+    return TeacherTraceMeta.model_construct(
         path=str(trace_path),
         action_count=action_count,
         summary=summary if isinstance(summary, str) else None,
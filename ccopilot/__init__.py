@@ -5,11 +5,13 @@ This module is intentionally lightweight so the package can be imported
 before the broader scaffolding (apps/, data/, etc.) is in place.
 """
 
-from importlib import metadata
-
 
 def get_version() -> str:
     """Return the installed project version."""
+    # importlib.metadata is comparatively slow to import and every CLI pays for the
+    # package __init__, so only load it when a version is actually requested.
+    from importlib import metadata
+
     try:
         return metadata.version("ccopilot")
     except metadata.PackageNotFoundError:
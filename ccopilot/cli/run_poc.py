@@ -3,19 +3,94 @@
 from __future__ import annotations
 
 import argparse
-import json
+import importlib
+import io
 import os
 import sys
+from contextlib import redirect_stdout
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable, List
+from typing import TYPE_CHECKING, Any, Iterable, List, Literal, Sequence
 
-from ccopilot.core.validation import ValidationFailure, strict_validation, validate_handcrafted_dataset
-from ccopilot.pipeline import PipelineRunArtifacts, bootstrap_pipeline, run_pipeline
+import orjson
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from ccopilot.utils.paths import resolve_optional, resolve_path
+
+if TYPE_CHECKING:
+    from ccopilot.pipeline import PipelineRunArtifacts
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
-def build_parser() -> argparse.ArgumentParser:
+# The pipeline stack (DSPy, LLM clients, world-model store) takes seconds to import, so
+# it is loaded on first use rather than at import time; ``--help`` and argument errors
+# then only pay for argparse. Resolved names are cached as module globals, which keeps
+# ``patch("ccopilot.cli.run_poc.bootstrap_pipeline")`` working.
+_LAZY_IMPORTS = {
+    "ValidationFailure": "ccopilot.core.validation",
+    "strict_validation": "ccopilot.core.validation",
+    "validate_handcrafted_dataset": "ccopilot.core.validation",
+    "bootstrap_pipeline": "ccopilot.pipeline",
+    "run_pipeline": "ccopilot.pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def _lazy(name: str) -> Any:
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+# Options that only shape a real pipeline run. ``--dry-run`` invocations that do not
+# mention them skip wiring them into the parser and get these defaults instead.
+_PIPELINE_ONLY_DEFAULTS: dict[str, Any] = {
+    "science_config": None,
+    "notebook": None,
+    "skip_notebook_create": False,
+    "ablations": None,
+    "ingest_world_model": False,
+    "offline_teacher": False,
+}
+_PIPELINE_ONLY_FLAGS = tuple("--" + dest.replace("_", "-") for dest in _PIPELINE_ONLY_DEFAULTS)
+
+CliMode = Literal["help", "dry", "full"]
+
+# The post-run summaries read the same manifest several times; parse it once per (mtime, size).
+_MANIFEST_CACHE: dict[str, tuple[tuple[int, int], dict[str, object] | None]] = {}
+_MANIFEST_CACHE_SIZE = 8
+_MANIFEST_SUMMARY_KEYS = ("scientific_metrics_artifact", "science_config_path", "stage_errors")
+_FAILED_EXPORT_STATUSES = frozenset({"error", "skipped"})
+_NOTE_ID_PREVIEW = 3
+_QUEUED_PATH_PREVIEW = 5
+# Artifact attributes echoed by the post-run ``[artifacts]`` line, in display order.
+_ARTIFACT_SUMMARY_FIELDS = ("course_plan", "lecture", "manifest", "eval_report", "provenance")
+
+
+def _sniff_mode(argv: Sequence[str]) -> CliMode:
+    """Classify an invocation before building the parser (mirrors anomalib's subcommand sniffing)."""
+
+    if any(token == "-h" or (len(token) > 2 and "--help".startswith(token)) for token in argv):
+        return "help"
+    if "--dry-run" not in argv:
+        return "full"
+    for token in argv:
+        if not token.startswith("--"):
+            continue
+        flag = token.split("=", 1)[0]
+        # argparse accepts unambiguous prefixes, so "--note" still means --notebook.
+        if any(option.startswith(flag) for option in _PIPELINE_ONLY_FLAGS):
+            return "full"
+    return "dry"
+
+
+def build_parser(mode: CliMode = "full") -> argparse.ArgumentParser:
+    pipeline_args = mode != "dry"
     parser = argparse.ArgumentParser(description="Run the CourseGen PoC orchestration pipeline.")
     parser.add_argument(
         "--config",
@@ -52,79 +127,91 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override the SQLite world-model store path defined in config.world_model.sqlite_path",
     )
-    parser.add_argument(
-        "--science-config",
-        default=None,
-        help=("Override the scientific evaluator config (defaults to config/scientific_config.yaml when present)."),
-    )
-    parser.add_argument(
-        "--notebook",
-        default=None,
-        help="Override the notebook slug used for Open Notebook exports.",
-    )
-    parser.add_argument(
-        "--skip-notebook-create",
-        action="store_true",
-        help="Do not auto-create the Open Notebook slug before publishing.",
-    )
-    parser.add_argument(
-        "--ablations",
-        default=None,
-        help="Comma-separated list of ablations (no_world_model,no_students,no_recursion)",
-    )
+    if pipeline_args:
+        parser.add_argument(
+            "--science-config",
+            default=None,
+            help=("Override the scientific evaluator config (defaults to config/scientific_config.yaml when present)."),
+        )
+        parser.add_argument(
+            "--notebook",
+            default=None,
+            help="Override the notebook slug used for Open Notebook exports.",
+        )
+        parser.add_argument(
+            "--skip-notebook-create",
+            action="store_true",
+            help="Do not auto-create the Open Notebook slug before publishing.",
+        )
+        parser.add_argument(
+            "--ablations",
+            default=None,
+            help="Comma-separated list of ablations (no_world_model,no_students,no_recursion)",
+        )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Only validate config and log bootstrap info without invoking the orchestrator.",
     )
-    parser.add_argument(
-        "--ingest-world-model",
-        action="store_true",
-        help="Rebuild the SQLite world model from the handcrafted dataset before running.",
-    )
+    if pipeline_args:
+        parser.add_argument(
+            "--ingest-world-model",
+            action="store_true",
+            help="Rebuild the SQLite world model from the handcrafted dataset before running.",
+        )
     parser.add_argument(
         "--quiet",
         action="store_true",
         help="Suppress evaluation/highlight summaries on stdout.",
     )
-    parser.add_argument(
-        "--offline-teacher",
-        action="store_true",
-        help="Skip the vendor Teacher RLM and force COURSEGEN_RLM_OFFLINE=1 for deterministic runs.",
-    )
+    if pipeline_args:
+        parser.add_argument(
+            "--offline-teacher",
+            action="store_true",
+            help="Skip the vendor Teacher RLM and force COURSEGEN_RLM_OFFLINE=1 for deterministic runs.",
+        )
+    if not pipeline_args:
+        parser.set_defaults(**_PIPELINE_ONLY_DEFAULTS)
     return parser
 
 
-def _resolve_path(value: str | Path, *, base: Path | None = None) -> Path:
-    candidate = Path(value).expanduser()
-    if candidate.is_absolute():
-        return candidate.resolve()
-    anchor = Path(base).expanduser().resolve() if base is not None else Path.cwd()
-    return (anchor / candidate).resolve()
+@lru_cache(maxsize=None)
+def _cached_parser(mode: CliMode) -> argparse.ArgumentParser:
+    # The option table is static and parse_args() leaves the parser untouched, so
+    # repeated main() calls (tests, wrappers) can share one parser per mode.
+    return build_parser(mode)
 
 
-def _resolve_optional(value: str | Path | None, *, base: Path | None = None) -> Path | None:
-    if value is None:
-        return None
-    return _resolve_path(value, base=base)
+def _set_env(name: str, value: str) -> None:
+    # Assigning os.environ always calls putenv(); skip it when the value is already in place.
+    if os.environ.get(name) != value:
+        os.environ[name] = value
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _cached_parser(_sniff_mode(argv))
     args = parser.parse_args(argv)
 
+    validation_failure = _lazy("ValidationFailure")
+    strict_validation = _lazy("strict_validation")
+    validate_handcrafted_dataset = _lazy("validate_handcrafted_dataset")
+    bootstrap_pipeline = _lazy("bootstrap_pipeline")
+    run_pipeline = _lazy("run_pipeline")
+
     try:
         if args.offline_teacher:
-            os.environ["COURSEGEN_RLM_OFFLINE"] = "1"
-        repo_root = _resolve_path(args.repo_root)
-        os.environ["COURSEGEN_REPO_ROOT"] = str(repo_root)
-        config_path = _resolve_path(args.config, base=repo_root)
-        constraints_path = _resolve_optional(args.constraints, base=repo_root)
-        concept_override = _resolve_optional(args.concept, base=repo_root)
-        dataset_override = _resolve_optional(args.dataset_dir, base=repo_root) or concept_override
-        output_dir_override = _resolve_optional(args.output_dir, base=repo_root)
-        world_model_store_override = _resolve_optional(args.world_model_store, base=repo_root)
-        science_config_override = _resolve_optional(args.science_config, base=repo_root)
+            _set_env("COURSEGEN_RLM_OFFLINE", "1")
+        repo_root = resolve_path(args.repo_root)
+        _set_env("COURSEGEN_REPO_ROOT", str(repo_root))
+        config_path = resolve_path(args.config, base=repo_root)
+        constraints_path = resolve_optional(args.constraints, base=repo_root)
+        concept_override = resolve_optional(args.concept, base=repo_root)
+        dataset_override = resolve_optional(args.dataset_dir, base=repo_root) or concept_override
+        output_dir_override = resolve_optional(args.output_dir, base=repo_root)
+        world_model_store_override = resolve_optional(args.world_model_store, base=repo_root)
+        science_config_override = resolve_optional(args.science_config, base=repo_root)
 
         strict_validation.validate_file_exists(config_path)
         if constraints_path is not None:
@@ -148,12 +235,21 @@ def main(argv: list[str] | None = None) -> int:
             science_config_path=science_config_override,
         )
         artifacts = run_pipeline(ctx, dry_run=args.dry_run)
-        _print_eval_summary(artifacts, quiet=args.quiet)
-        _print_scientific_summary(artifacts, quiet=args.quiet)
-        _print_highlight_hint(artifacts, quiet=args.quiet)
-        _print_notebook_hint(artifacts, quiet=args.quiet)
-        _print_artifact_summary(artifacts, quiet=args.quiet)
-    except (FileNotFoundError, ValidationFailure, ValueError) as exc:
+        # Summaries read the eval report and manifest back from disk; skip them outright
+        # for quiet and dry runs instead of letting each helper bail out individually.
+        if artifacts is not None and not args.quiet:
+            # Collect the summary lines and emit them with one write instead of a print per line.
+            buffer = io.StringIO()
+            try:
+                with redirect_stdout(buffer):
+                    _print_eval_summary(artifacts)
+                    _print_scientific_summary(artifacts)
+                    _print_highlight_hint(artifacts)
+                    _print_notebook_hint(artifacts)
+                    _print_artifact_summary(artifacts)
+            finally:
+                sys.stdout.write(buffer.getvalue())
+    except (FileNotFoundError, validation_failure, ValueError) as exc:
         parser.error(str(exc))
     except Exception as exc:  # noqa: BLE001 - bubble up to CLI for now
         print(f"[run_poc] error: {exc}", file=sys.stderr)
@@ -162,19 +258,18 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
-def _print_eval_summary(artifacts: PipelineRunArtifacts | None, *, quiet: bool = False) -> None:
+def _print_eval_summary(artifacts: PipelineRunArtifacts | None) -> None:
     """Emit a human-readable evaluation summary for CLI users."""
 
-    if artifacts is None or quiet:
+    if artifacts is None:
         return
 
     eval_path = artifacts.eval_report
-    if not eval_path.exists():
-        print(f"[eval] report missing at {eval_path}")
-        return
-
     try:
         record = _load_eval_record(eval_path)
+    except FileNotFoundError:
+        print(f"[eval] report missing at {eval_path}")
+        return
     except ValueError as exc:
         print(f"[eval] unable to read {eval_path}: {exc}")
         return
@@ -186,22 +281,20 @@ def _print_eval_summary(artifacts: PipelineRunArtifacts | None, *, quiet: bool =
 
     overall = record.get("overall_score")
     overall_display = _format_score(overall)
-    engines: list[str] = []
-    rubric_engine = record.get("rubric_engine")
-    quiz_engine = record.get("quiz_engine")
-    if rubric_engine:
-        engines.append(f"rubric={rubric_engine}")
-    if quiz_engine:
-        engines.append(f"quiz={quiz_engine}")
+    engines = [
+        f"{label}={engine}"
+        for label, engine in (("rubric", record.get("rubric_engine")), ("quiz", record.get("quiz_engine")))
+        if engine
+    ]
     engine_hint = f" ({', '.join(engines)})" if engines else ""
     rubric_summary = _format_rubric_summary(record.get("rubrics") or [])
     print(f"[eval] overall={overall_display}{engine_hint} | rubrics: {rubric_summary} | report={eval_path}")
 
 
-def _print_scientific_summary(artifacts: PipelineRunArtifacts | None, *, quiet: bool = False) -> None:
+def _print_scientific_summary(artifacts: PipelineRunArtifacts | None) -> None:
     """Summarize scientific evaluation metrics on stdout."""
 
-    if artifacts is None or quiet:
+    if artifacts is None:
         return
 
     metrics = getattr(artifacts, "scientific_metrics", None)
@@ -235,35 +328,41 @@ def _print_scientific_summary(artifacts: PipelineRunArtifacts | None, *, quiet:
 
 
 def _load_eval_record(path: Path) -> dict[str, Any]:
-    line = path.read_text(encoding="utf-8").splitlines()
+    # Only the first JSONL record is summarised; don't read the rest of the report.
+    with path.open("rb") as handle:
+        line = handle.readline()
     if not line:
         raise ValueError("empty evaluation file")
     try:
-        return json.loads(line[0])
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+        return orjson.loads(line)
+    except orjson.JSONDecodeError as exc:  # pragma: no cover - defensive
         raise ValueError("invalid JSON in evaluation file") from exc
 
 
 def _format_score(value: Any) -> str:
-    if isinstance(value, (int, float)):
-        return f"{value:.3f}"
-    return str(value) if value is not None else "n/a"
+    if value is None:
+        return "n/a"
+    # Let format() dispatch on the type in C; strings and containers reject ".3f".
+    try:
+        return format(value, ".3f")
+    except (TypeError, ValueError):
+        return str(value)
 
 
 def _format_rubric_summary(rubrics: Iterable[dict[str, Any]]) -> str:
-    items = []
-    for rubric in rubrics:
-        name = str(rubric.get("name", "?"))
-        score = _format_score(rubric.get("score"))
-        passed = "PASS" if rubric.get("passed") else "FAIL"
-        items.append(f"{name}:{passed}({score})")
-    return ", ".join(items) if items else "no rubrics"
+    return (
+        ", ".join(
+            f"{rubric.get('name', '?')}:{'PASS' if rubric.get('passed') else 'FAIL'}({_format_score(rubric.get('score'))})"
+            for rubric in rubrics
+        )
+        or "no rubrics"
+    )
 
 
-def _print_highlight_hint(artifacts: PipelineRunArtifacts | None, *, quiet: bool = False) -> None:
+def _print_highlight_hint(artifacts: PipelineRunArtifacts | None) -> None:
     """Surface the highlight artifact path (if any) after the run."""
 
-    if artifacts is None or quiet:
+    if artifacts is None:
         return
 
     highlight_path = getattr(artifacts, "highlights", None)
@@ -280,8 +379,8 @@ def _print_highlight_hint(artifacts: PipelineRunArtifacts | None, *, quiet: bool
         print(f"[highlights] expected at {highlight_path} (missing)")
 
 
-def _print_notebook_hint(artifacts: PipelineRunArtifacts | None, *, quiet: bool = False) -> None:
-    if artifacts is None or quiet:
+def _print_notebook_hint(artifacts: PipelineRunArtifacts | None) -> None:
+    if artifacts is None:
         return
 
     exports: List[dict[str, Any]] | None = getattr(artifacts, "notebook_exports", None)
@@ -306,44 +405,65 @@ def _print_notebook_hint(artifacts: PipelineRunArtifacts | None, *, quiet: bool
     if not responses:
         return
 
-    successes = [resp for resp in responses if resp.get("status") not in {"error", "skipped"}]
-    failures = [resp for resp in responses if resp.get("status") in {"error", "skipped"}]
-    target = next(
-        (resp.get("notebook") or resp.get("notebook_slug") for resp in responses if resp),
-        None,
-    )
+    successes: List[dict[str, Any]] = []
+    failures: List[dict[str, Any]] = []
+    fallback_note_ids: list[Any] = []
+    fallback_queued: set[Any] = set()
+    target = None
+    target_found = False
+    error_count = skipped_count = 0
+    queued_overflow = False
+    for resp in responses:
+        if not target_found and resp:
+            target = resp.get("notebook") or resp.get("notebook_slug")
+            target_found = True
+        status = resp.get("status")
+        if status in _FAILED_EXPORT_STATUSES:
+            failures.append(resp)
+            if status == "error":
+                error_count += 1
+            else:
+                skipped_count += 1
+            continue
+        successes.append(resp)
+        # Only the preview is printed; one extra id is enough to signal the overflow.
+        if len(fallback_note_ids) <= _NOTE_ID_PREVIEW:
+            note_id = resp.get("note_id") or resp.get("id")
+            if note_id:
+                fallback_note_ids.append(note_id)
+        if status == "queued":
+            export_path = resp.get("export_path")
+            if export_path and export_path not in fallback_queued:
+                if len(fallback_queued) < _QUEUED_PATH_PREVIEW:
+                    fallback_queued.add(export_path)
+                else:
+                    queued_overflow = True
+
     total = summary.get("total") if summary else len(responses)
     success_count = summary.get("success") if summary else len(successes)
     if successes:
         slug_display = target or "notebook"
-        note_ids = (
-            summary.get("note_ids", [])
-            if summary
-            else [resp.get("note_id") or resp.get("id") for resp in successes if resp.get("note_id") or resp.get("id")]
-        )
-        queued_paths = (
-            summary.get("queued_exports", [])
-            if summary
-            else sorted({resp.get("export_path") for resp in successes if resp.get("status") == "queued" and resp.get("export_path")})
-        )
+        note_ids = summary.get("note_ids", []) if summary else fallback_note_ids
+        if summary:
+            queued_paths = summary.get("queued_exports", [])
+        else:
+            queued_paths = sorted(fallback_queued)
+            if queued_overflow:
+                queued_paths.append("…")
         detail = ""
         if note_ids:
-            preview = ", ".join(note_ids[:3])
-            if len(note_ids) > 3:
+            preview = ", ".join(note_ids[:_NOTE_ID_PREVIEW])
+            if len(note_ids) > _NOTE_ID_PREVIEW:
                 preview += ", …"
             detail = f" (notes: {preview})"
         elif queued_paths:
             detail = f" (queued at {', '.join(queued_paths)})"
         elif failures:
-            error_count = sum(1 for resp in failures if str(resp.get("status", "")).lower() == "error")
-            skipped_count = sum(1 for resp in failures if str(resp.get("status", "")).lower() == "skipped")
             labels: list[str] = []
             if error_count:
                 labels.append(f"{error_count} error{'s' if error_count != 1 else ''}")
             if skipped_count:
                 labels.append(f"{skipped_count} skipped")
-            if not labels:
-                labels.append(f"{len(failures)} issue(s)")
             detail = f" ({', '.join(labels)}; see manifest)"
         print(f"[notebook] exported {success_count or len(successes)}/{total} sections -> {slug_display}{detail}")
     else:
@@ -355,30 +475,19 @@ def _print_notebook_hint(artifacts: PipelineRunArtifacts | None, *, quiet: bool
         print(f"[notebook] export unavailable (status={status}{error_fragment}{reason_fragment}); see manifest for details")
 
 
-def _print_artifact_summary(artifacts: PipelineRunArtifacts | None, *, quiet: bool = False) -> None:
+def _print_artifact_summary(artifacts: PipelineRunArtifacts | None) -> None:
     """Emit a concise map of key artifact paths for reproducibility."""
 
-    if artifacts is None or quiet:
+    if artifacts is None:
         return
 
-    science_candidate = getattr(artifacts, "scientific_metrics_path", None)
-    if not science_candidate:
-        science_candidate = _read_science_path_from_manifest(getattr(artifacts, "manifest", None))
-
-    science_config_candidate = getattr(artifacts, "science_config_path", None)
-    if not science_config_candidate:
-        science_config_candidate = _read_science_config_from_manifest(getattr(artifacts, "manifest", None))
+    paths = {label: getattr(artifacts, label, None) for label in _ARTIFACT_SUMMARY_FIELDS}
+    manifest = paths["manifest"]
+    paths["science"] = getattr(artifacts, "scientific_metrics_path", None) or _read_science_path_from_manifest(manifest)
+    paths["science_config"] = getattr(artifacts, "science_config_path", None) or _read_science_config_from_manifest(manifest)
 
     entries: list[str] = []
-    for label, value in (
-        ("course_plan", getattr(artifacts, "course_plan", None)),
-        ("lecture", getattr(artifacts, "lecture", None)),
-        ("manifest", getattr(artifacts, "manifest", None)),
-        ("eval_report", getattr(artifacts, "eval_report", None)),
-        ("provenance", getattr(artifacts, "provenance", None)),
-        ("science", science_candidate),
-        ("science_config", science_config_candidate),
-    ):
+    for label, value in paths.items():
         formatted = _stringify_path(value)
         if formatted:
             entries.append(f"{label}={formatted}")
@@ -399,13 +508,13 @@ def _print_artifact_summary(artifacts: PipelineRunArtifacts | None, *, quiet: bo
             fragments.append(f"trace={trace_path}")
         print(f"[teacher] {' | '.join(fragments)}")
 
-    _print_stage_error_summary(artifacts, quiet=quiet)
+    _print_stage_error_summary(artifacts)
 
 
 def _stringify_path(path_value: Path | str | None) -> str | None:
     if not path_value:
         return None
-    return str(Path(path_value).expanduser().resolve())
+    return str(resolve_path(path_value))
 
 
 def _read_manifest_path(manifest_path: Path | str | None, field: str) -> Path | None:
@@ -434,8 +543,8 @@ def _read_stage_errors_from_manifest(manifest_path: Path | str | None) -> list[d
     return []
 
 
-def _print_stage_error_summary(artifacts: PipelineRunArtifacts | None, *, quiet: bool = False) -> None:
-    if artifacts is None or quiet:
+def _print_stage_error_summary(artifacts: PipelineRunArtifacts | None) -> None:
+    if artifacts is None:
         return
     manifest_path = getattr(artifacts, "manifest", None)
     errors = _read_stage_errors_from_manifest(manifest_path)
@@ -457,13 +566,29 @@ def _load_manifest_json(manifest_path: Path | str | None) -> dict[str, object] |
     if not manifest_path:
         return None
     path = Path(manifest_path)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return None
+    # The summaries pass the same path object around, so the string form is a stable key
+    # without a resolve() per lookup; size catches rewrites within one mtime tick.
+    key = str(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _MANIFEST_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:  # pragma: no cover - defensive
+        payload = orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except orjson.JSONDecodeError:  # pragma: no cover - defensive
         return None
-    return payload if isinstance(payload, dict) else None
+    # Cache only the fields the summaries read so large trace payloads are not kept alive.
+    result = {field: payload[field] for field in _MANIFEST_SUMMARY_KEYS if field in payload} if isinstance(payload, dict) else None
+    if len(_MANIFEST_CACHE) >= _MANIFEST_CACHE_SIZE:
+        _MANIFEST_CACHE.clear()
+    _MANIFEST_CACHE[key] = (signature, result)
+    return result
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AblationSwitch(str, Enum):
@@ -23,6 +23,8 @@ class AblationSwitch(str, Enum):
 class AblationConfig(BaseModel):
     """Representation of which subsystems are disabled for a run."""
 
+    model_config = ConfigDict(frozen=True)
+
     use_world_model: bool = True
     use_students: bool = True
     allow_recursion: bool = True
@@ -38,6 +40,15 @@ class AblationConfig(BaseModel):
         return ", ".join(enabled) if enabled else "none"
 
 
+# Token -> AblationConfig field each switch turns off.
+_DISABLED_FIELD_BY_TOKEN = {
+    AblationSwitch.NO_WORLD_MODEL.value: "use_world_model",
+    AblationSwitch.NO_STUDENTS.value: "use_students",
+    AblationSwitch.NO_RECURSION.value: "allow_recursion",
+}
+_VALID_CHOICES = ", ".join(AblationSwitch.choices())
+
+
 def parse_ablation_flag(flag_value: str | None) -> AblationConfig:
     """
     Convert a comma-separated CLI flag into an AblationConfig.
@@ -48,23 +59,17 @@ def parse_ablation_flag(flag_value: str | None) -> AblationConfig:
     - ``no_students`` → student agents disabled, everything else on.
     - ``no_world_model,no_recursion`` → disable world model + recursion.
     """
-    config = AblationConfig()
     if not flag_value:
-        return config
-
-    tokens = [token.strip().lower() for token in flag_value.split(",") if token.strip()]
-    for token in tokens:
-        try:
-            switch = AblationSwitch(token)
-        except ValueError as exc:
-            valid = ", ".join(AblationSwitch.choices())
-            raise ValueError(f"Unknown ablation '{token}'. Valid options: {valid}") from exc
-
-        if switch is AblationSwitch.NO_WORLD_MODEL:
-            config.use_world_model = False
-        elif switch is AblationSwitch.NO_STUDENTS:
-            config.use_students = False
-        elif switch is AblationSwitch.NO_RECURSION:
-            config.allow_recursion = False
-
-    return config
+        return AblationConfig()
+
+    disabled: dict[str, bool] = {}
+    for raw in flag_value.split(","):
+        token = raw.strip().lower()
+        if not token:
+            continue
+        field = _DISABLED_FIELD_BY_TOKEN.get(token)
+        if field is None:
+            raise ValueError(f"Unknown ablation '{token}'. Valid options: {_VALID_CHOICES}")
+        disabled[field] = False
+
+    return AblationConfig(**disabled)
@@ -8,6 +8,9 @@ scaffolding to land. They will be imported by the eventual `run_poc` CLI.
 
 from __future__ import annotations
 
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional
 
@@ -21,10 +24,28 @@ from pydantic import (
     model_validator,
 )
 
+# libyaml's C loader parses several times faster than the pure-Python SafeLoader and
+# accepts the same documents; PyYAML builds without libyaml fall back to the latter.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+DISABLE_CONFIG_CACHE_ENV = "COURSEGEN_DISABLE_CONFIG_CACHE"
+
+
+_STRIPPED_LIST_FIELDS = ("required_sources", "banned_sources", "focus_areas", "learning_objectives")
+
+
+def _strip_items(value: Any) -> Any:
+    if isinstance(value, list):
+        return [item.strip() if isinstance(item, str) else item for item in value]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
 
 class CourseAudience(BaseModel):
     """High-level description of the intended learner."""
 
+    model_config = ConfigDict(frozen=True)
+
     persona: str = Field(..., description="Short label for the learner persona.")
     prior_knowledge: List[str] = Field(default_factory=list, description="List of prerequisite skills the learner is assumed to have.")
     goals: List[str] = Field(default_factory=list, description="Desired outcomes for the learner.")
@@ -33,7 +54,7 @@ class CourseAudience(BaseModel):
 class CourseConstraints(BaseModel):
     """Domain-specific levers that drive the plan + lecture generation."""
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
 
     title: str
     description: Optional[str] = None
@@ -45,28 +66,25 @@ class CourseConstraints(BaseModel):
     banned_sources: List[str] = Field(default_factory=list)
     learning_objectives: List[str] = Field(default_factory=list)
 
-    @field_validator(
-        "required_sources",
-        "banned_sources",
-        "focus_areas",
-        "learning_objectives",
-        mode="before",
-    )
+    @model_validator(mode="before")
     @classmethod
-    def strip_items(cls, value: Any) -> Any:
-        if value is None:
-            return value
-        if isinstance(value, list):
-            return [item.strip() if isinstance(item, str) else item for item in value]
-        if isinstance(value, str):
-            return value.strip()
-        return value
+    def strip_items(cls, data: Any) -> Any:
+        # One pass over the string-list fields instead of four per-field validator calls.
+        # Pydantic ignores the result on assignment, so merge_course_constraints strips
+        # its overrides itself.
+        if not isinstance(data, dict) or not any(key in data for key in _STRIPPED_LIST_FIELDS):
+            return data
+        payload = dict(data)
+        for key in _STRIPPED_LIST_FIELDS:
+            if key in payload:
+                payload[key] = _strip_items(payload[key])
+        return payload
 
 
 class RoleModelConfig(BaseModel):
     """Provider-specific configuration for a single LM role."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     provider: Literal["openai"] = "openai"
     model: str
@@ -81,10 +99,13 @@ class RoleModelConfig(BaseModel):
         return getattr(self, "model_extra", {})
 
 
+_LEGACY_MODEL_KEYS = frozenset({"teacher_model", "ta_model", "student_model"})
+
+
 class ModelConfig(BaseModel):
     """LLM/model defaults for teacher, TA, and student agents."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     teacher: RoleModelConfig = Field(default_factory=lambda: RoleModelConfig(model="gpt-5.1", reasoning={"effort": "high"}))
     ta: RoleModelConfig = Field(default_factory=lambda: RoleModelConfig(model="gpt-5-mini"))
@@ -105,7 +126,7 @@ class ModelConfig(BaseModel):
         # Flatten nested "models" blocks if present (e.g., config/model_config.yaml reference)
         models_block = payload.pop("models", None)
         if isinstance(models_block, dict):
-            payload = {**payload, **models_block}
+            payload.update(models_block)
 
         # Normalize plural keys
         if "students" in payload and "student" not in payload:
@@ -114,7 +135,7 @@ class ModelConfig(BaseModel):
             payload["ta"] = payload.pop("teaching_assistants")
 
         # Transform legacy flat fields
-        if "teacher" not in payload and any(key in payload for key in ("teacher_model", "ta_model", "student_model")):
+        if "teacher" not in payload and not _LEGACY_MODEL_KEYS.isdisjoint(payload):
             teacher_model = payload.pop("teacher_model", None) or "gpt-5.1"
             ta_model = payload.pop("ta_model", None) or "gpt-5-mini"
             student_model = payload.pop("student_model", None) or ta_model or "gpt-5-mini"
@@ -131,10 +152,11 @@ class ModelConfig(BaseModel):
                 payload["default_temperature"] = legacy_temp
             if legacy_tokens is not None:
                 payload["default_max_tokens"] = legacy_tokens
-
-        payload.setdefault("teacher", {"provider": "openai", "model": "gpt-5.1", "reasoning": {"effort": "high"}})
-        payload.setdefault("ta", {"provider": "openai", "model": "gpt-5-mini"})
-        payload.setdefault("student", {"provider": "openai", "model": payload["ta"]["model"]})
+        else:
+            # The legacy branch above always fills teacher/ta/student itself.
+            payload.setdefault("teacher", {"provider": "openai", "model": "gpt-5.1", "reasoning": {"effort": "high"}})
+            payload.setdefault("ta", {"provider": "openai", "model": "gpt-5-mini"})
+            payload.setdefault("student", {"provider": "openai", "model": payload["ta"]["model"]})
         payload.setdefault("coder", {"provider": "openai", "model": "gpt-5.1-codex-mini"})
 
         return payload
@@ -166,6 +188,8 @@ class ModelConfig(BaseModel):
 class NotebookConfig(BaseModel):
     """Connection info for the Open Notebook instance."""
 
+    model_config = ConfigDict(frozen=True)
+
     api_base: str
     notebook_slug: str = Field(default="database-systems-poc")
     auth_token: Optional[str] = None
@@ -175,7 +199,7 @@ class NotebookConfig(BaseModel):
 class WorldModelConfig(BaseModel):
     """Paths and settings for the symbolic world model store."""
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
 
     schema_path: Path
     dataset_dir: Path
@@ -190,7 +214,7 @@ class WorldModelConfig(BaseModel):
 class EvaluationConfig(BaseModel):
     """Rubrics + quiz bank inputs used by student agents."""
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(frozen=True)
 
     rubrics_path: Path = Field(default=Path("evals/rubrics.yaml"))
     quiz_bank_path: Path = Field(default=Path("data/handcrafted/database_systems/quiz_bank.json"))
@@ -207,9 +231,14 @@ class EvaluationConfig(BaseModel):
         return Path(value).expanduser().resolve()
 
 
+_REQUIRED_PIPELINE_SECTIONS = ("course", "notebook", "world_model")
+
+
 class PipelineConfig(BaseModel):
     """Top-level configuration for the orchestrator pipeline."""
 
+    model_config = ConfigDict(frozen=True)
+
     course: CourseConstraints
     models: ModelConfig = Field(default_factory=ModelConfig)
     notebook: NotebookConfig
@@ -219,42 +248,57 @@ class PipelineConfig(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def ensure_sections_present(cls, values: Dict[str, Any]) -> Dict[str, Any]:
-        missing = [key for key in ("course", "notebook", "world_model") if key not in values]
-        if missing:
-            raise ValueError(f"Missing config sections: {', '.join(missing)}")
-        return values
+        if "course" in values and "notebook" in values and "world_model" in values:
+            return values
+        missing = [key for key in _REQUIRED_PIPELINE_SECTIONS if key not in values]
+        raise ValueError(f"Missing config sections: {', '.join(missing)}")
 
 
 def read_yaml_file(path: Path) -> Dict[str, Any]:
-    """Load a YAML file and return a dictionary."""
-    with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+    """Load a YAML file and return a dictionary.
+
+    Parses are cached per (path, mtime, size), so repeated bootstraps of the same config
+    skip YAML parsing; callers get a private copy they are free to mutate. Set
+    ``COURSEGEN_DISABLE_CONFIG_CACHE=1`` to always re-read from disk.
+    """
+    if os.environ.get(DISABLE_CONFIG_CACHE_ENV) == "1":
+        return _parse_yaml_file(path)
+    stat = path.stat()
+    return copy.deepcopy(_read_yaml_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _read_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return _parse_yaml_file(Path(path))
+
+
+def _parse_yaml_file(path: Path) -> Dict[str, Any]:
+    # Hand libyaml the raw bytes; it detects and decodes UTF-8 itself instead of us doing it first.
+    data = yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
     if not isinstance(data, dict):
         raise ValueError(f"Expected mapping at root of {path}, received {type(data)}")
     return data
 
 
-def _resolve_config_path(value: Any, base_dir: Path) -> str:
+def _anchor_config_path(value: Any, base_dir: Path) -> str:
     path = Path(value).expanduser()
-    if not path.is_absolute():
-        path = (base_dir / path).resolve()
-    else:
-        path = path.resolve()
-    return str(path)
+    return str(path if path.is_absolute() else base_dir / path)
 
 
 def _absolutize_pipeline_paths(data: Dict[str, Any], base_dir: Path) -> None:
+    # Only anchor relative entries to base_dir here; the coerce_path validators on
+    # WorldModelConfig/EvaluationConfig perform the single resolve() for every path.
     world_model = data.get("world_model")
     if isinstance(world_model, dict):
         for key in ("schema_path", "dataset_dir", "sqlite_path"):
             if world_model.get(key):
-                world_model[key] = _resolve_config_path(world_model[key], base_dir)
+                world_model[key] = _anchor_config_path(world_model[key], base_dir)
 
     evaluation = data.get("evaluation")
     if isinstance(evaluation, dict):
         for key in ("rubrics_path", "quiz_bank_path"):
             if evaluation.get(key):
-                evaluation[key] = _resolve_config_path(evaluation[key], base_dir)
+                evaluation[key] = _anchor_config_path(evaluation[key], base_dir)
 
 
 def load_course_constraints(path: Path) -> CourseConstraints:
@@ -281,11 +325,20 @@ def merge_course_constraints(base: CourseConstraints, overrides: Dict[str, Any])
     """
     Return a new CourseConstraints object by applying overrides on top of the base config.
 
-    This is useful for ablations or quick experiments driven by CLI flags.
+    This is useful for ablations or quick experiments driven by CLI flags. Only the
+    overridden fields are re-validated; untouched fields are shared with ``base``, so
+    treat nested lists on the result as read-only.
     """
-    payload = base.model_dump()
-    payload.update(overrides)
+    merged = base.model_copy()
+    # validate_assignment works on the private copy even though the model is frozen.
+    validator = CourseConstraints.__pydantic_validator__
     try:
-        return CourseConstraints.model_validate(payload)
+        for field, value in overrides.items():
+            # model_validate ignored unknown keys; keep that behaviour.
+            if field in CourseConstraints.model_fields:
+                if field in _STRIPPED_LIST_FIELDS:
+                    value = _strip_items(value)
+                validator.validate_assignment(merged, field, value)
     except ValidationError as exc:
         raise ValueError("Invalid overrides for CourseConstraints") from exc
+    return merged
@@ -51,38 +51,38 @@ def _build_openai_lm(
     return lm_cls(**kwargs)
 
 
-def _resolve_api_key(role_cfg: RoleModelConfig, role_name: str) -> str | None:
-    preferred_envs = []
-    if role_cfg.api_key_env:
-        preferred_envs.append(role_cfg.api_key_env)
-    preferred_envs.append(f"OPENAI_API_KEY_{role_name.upper()}")
-    preferred_envs.append("OPENAI_API_KEY")
-    for env_var in preferred_envs:
-        if env_var and (value := os.getenv(env_var)):
+# Env vars consulted after a role's explicit *_env override, precomputed for the known roles.
+_ROLE_KEY_ENVS = {role: (f"OPENAI_API_KEY_{role.upper()}", "OPENAI_API_KEY") for role in ("teacher", "ta", "coder", "student")}
+_ROLE_BASE_ENVS = {role: (f"OPENAI_API_BASE_{role.upper()}", "OPENAI_API_BASE") for role in ("teacher", "ta", "coder", "student")}
+
+
+def _first_env(override: str | None, defaults: tuple[str, str]) -> str | None:
+    if override and (value := os.getenv(override)):
+        return value
+    for env_var in defaults:
+        if value := os.getenv(env_var):
             return value
     return None
 
 
+def _resolve_api_key(role_cfg: RoleModelConfig, role_name: str) -> str | None:
+    defaults = _ROLE_KEY_ENVS.get(role_name) or (f"OPENAI_API_KEY_{role_name.upper()}", "OPENAI_API_KEY")
+    return _first_env(role_cfg.api_key_env, defaults)
+
+
 def _resolve_api_base(role_cfg: RoleModelConfig, role_name: str) -> str | None:
     if role_cfg.api_base:
         return role_cfg.api_base
-    env_candidates = []
-    if role_cfg.api_base_env:
-        env_candidates.append(role_cfg.api_base_env)
-    env_candidates.append(f"OPENAI_API_BASE_{role_name.upper()}")
-    env_candidates.append("OPENAI_API_BASE")
-    for env_var in env_candidates:
-        if env_var and (value := os.getenv(env_var)):
-            return value
-    return None
+    defaults = _ROLE_BASE_ENVS.get(role_name) or (f"OPENAI_API_BASE_{role_name.upper()}", "OPENAI_API_BASE")
+    return _first_env(role_cfg.api_base_env, defaults)
 
 
-def _build_model_for_role(
+def _role_lm_kwargs(
     role_cfg: RoleModelConfig,
     role_name: str,
     model_cfg: ModelConfig,
     override_key: str | None,
-) -> object:
+) -> Dict[str, Any]:
     if role_cfg.provider != "openai":
         raise DSPyConfigurationError(f"Unsupported provider '{role_cfg.provider}' for role '{role_name}'")
 
@@ -91,29 +91,49 @@ def _build_model_for_role(
         expected_env = role_cfg.api_key_env or f"OPENAI_API_KEY_{role_name.upper()}"
         raise DSPyConfigurationError(f"Missing API key for {role_name} models; set {expected_env} or OPENAI_API_KEY.")
 
-    api_base = _resolve_api_base(role_cfg, role_name)
-    temperature = role_cfg.temperature if role_cfg.temperature is not None else model_cfg.default_temperature
-    max_tokens = role_cfg.max_tokens if role_cfg.max_tokens is not None else model_cfg.default_max_tokens
-
-    return _build_openai_lm(
-        role_cfg.model,
-        api_key=api_key,
-        temperature=temperature,
-        max_tokens=max_tokens,
-        api_base=api_base,
-        extra_kwargs=role_cfg.extra_kwargs,
-    )
-
-
-def configure_dspy_models(model_cfg: ModelConfig, *, api_key: str | None = None) -> DSPyModelHandles:
-    """Instantiate DSPy OpenAI LMs for the teacher, TA dialog, coder CodeAct runs, and students."""
+    return {
+        "model_name": role_cfg.model,
+        "api_key": api_key,
+        "temperature": role_cfg.temperature if role_cfg.temperature is not None else model_cfg.default_temperature,
+        "max_tokens": role_cfg.max_tokens if role_cfg.max_tokens is not None else model_cfg.default_max_tokens,
+        "api_base": _resolve_api_base(role_cfg, role_name),
+        "extra_kwargs": role_cfg.extra_kwargs,
+    }
 
-    teacher = _build_model_for_role(model_cfg.teacher, "teacher", model_cfg, api_key)
-    ta = _build_model_for_role(model_cfg.ta, "ta", model_cfg, api_key)
-    coder = _build_model_for_role(model_cfg.coder, "coder", model_cfg, api_key)
-    student = _build_model_for_role(model_cfg.student, "student", model_cfg, api_key)
 
-    dspy.settings.configure(lm=teacher)
+def configure_dspy_models(
+    model_cfg: ModelConfig,
+    *,
+    api_key: str | None = None,
+    configure_default: bool = True,
+) -> DSPyModelHandles:
+    """Instantiate DSPy OpenAI LMs for the teacher, TA dialog, coder CodeAct runs, and students.
+
+    The teacher LM is installed as DSPy's global default unless ``configure_default`` is False,
+    for callers that pin LMs per call via ``dspy.context(lm=...)`` and install ``handles.teacher``
+    themselves (at most once).
+    """
+
+    # Roles that resolve to identical settings (typically ta/student) share one LM handle.
+    # Extra kwargs may hold dicts, so match on equality rather than hashing.
+    built: list[tuple[Dict[str, Any], object]] = []
+
+    def build(role_cfg: RoleModelConfig, role_name: str) -> object:
+        kwargs = _role_lm_kwargs(role_cfg, role_name, model_cfg, api_key)
+        for previous, lm in built:
+            if previous == kwargs:
+                return lm
+        lm = _build_openai_lm(**kwargs)
+        built.append((kwargs, lm))
+        return lm
+
+    teacher = build(model_cfg.teacher, "teacher")
+    ta = build(model_cfg.ta, "ta")
+    coder = build(model_cfg.coder, "coder")
+    student = build(model_cfg.student, "student")
+
+    if configure_default:
+        dspy.settings.configure(lm=teacher)
 
     return DSPyModelHandles(teacher=teacher, ta=ta, student=student, coder=coder)
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Iterator, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ProvenanceEvent(BaseModel):
@@ -25,20 +27,69 @@ class ProvenanceLogger:
     def __init__(self, output_path: Path):
         self.output_path = output_path
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pending: List[ProvenanceEvent] | None = None
 
     def log(self, event: ProvenanceEvent | Dict[str, Any]) -> ProvenanceEvent:
         """Write a single event to disk and return the normalized object."""
-        if not isinstance(event, ProvenanceEvent):
-            event = ProvenanceEvent(**event)
-        line = event.model_dump_json()
-        with self.output_path.open("a", encoding="utf-8") as handle:
-            handle.write(line + "\n")
+        event = _normalize_event(event)
+        if self._pending is not None:
+            self._pending.append(event)
+            return event
+        _append(self.output_path, _EVENT_ADAPTER.dump_json(event) + b"\n")
         return event
 
     def extend(self, events: Iterable[ProvenanceEvent | Dict[str, Any]]) -> None:
-        """Batch-write multiple events."""
-        for event in events:
-            self.log(event)
+        """Batch-write multiple events with a single open and write."""
+        lines = [_EVENT_ADAPTER.dump_json(_normalize_event(event)) for event in events]
+        if not lines:
+            return
+        _append(self.output_path, b"\n".join(lines) + b"\n")
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Hold ``log()`` events in memory and append them with one write on exit.
+
+        Useful around a stage that logs per item::
+
+            with ctx.provenance.batch():
+                for item in items:
+                    run_agent(item)
+
+        Events are flushed even if the block raises. Nested batches flush with the outermost one.
+        """
+        if self._pending is not None:
+            yield
+            return
+        self._pending = []
+        try:
+            yield
+        finally:
+            pending, self._pending = self._pending, None
+            self.extend(pending)
+
+
+# Compiled once; dump_json() emits UTF-8 bytes, so events are appended without a decode/encode round trip.
+_EVENT_ADAPTER = TypeAdapter(ProvenanceEvent)
+
+
+# Same flags as open("ab"); O_BINARY stops Windows from translating newlines.
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _append(path: Path, data: bytes) -> None:
+    # Raw fd writes skip the FileIO/BufferedWriter layers; the file is still opened per
+    # write so readers see every event immediately and no descriptor outlives the call.
+    fd = os.open(path, _APPEND_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _normalize_event(event: ProvenanceEvent | Dict[str, Any]) -> ProvenanceEvent:
+    return event if isinstance(event, ProvenanceEvent) else _EVENT_ADAPTER.validate_python(event)
 
 
 __all__ = ["ProvenanceEvent", "ProvenanceLogger"]
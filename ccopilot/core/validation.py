@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import errno
 import functools
-import json
+import inspect
 import logging
+import os
+import signal
+import stat
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Type, TypeVar
 
+import orjson
 import yaml
 from pydantic import BaseModel, ValidationError
 
@@ -18,6 +24,14 @@ from pydantic import BaseModel, ValidationError
 T = TypeVar("T")
 F = TypeVar("F", bound=Callable[..., Any])
 
+# libyaml's C loader when PyYAML was built with it, same as ccopilot.core.config.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# All instances log through the same module logger; resolve it and the level names once.
+_LOGGER = logging.getLogger(__name__)
+_LOG_LEVELS = logging.getLevelNamesMapping()
+# stat() errnos that Path.exists() treats as "missing" rather than raising.
+_MISSING_PATH_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+
 
 class ValidationFailure(ValueError):
     """Raised when validation fails in strict mode."""
@@ -27,7 +41,7 @@ class ValidationFailure(ValueError):
         self.errors = errors or []
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check."""
 
@@ -58,8 +72,12 @@ class ValidationFramework:
             log_level: Logging level for validation messages
         """
         self.strict = strict
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(getattr(logging, log_level.upper()))
+        self.logger = _LOGGER
+        name = log_level.upper()
+        level = _LOG_LEVELS[name] if name in _LOG_LEVELS else getattr(logging, name)
+        # setLevel() clears every logger's level cache under the logging lock; skip it when unchanged.
+        if self.logger.level != level:
+            self.logger.setLevel(level)
 
     # ============== File Operations ==============
 
@@ -69,22 +87,22 @@ class ValidationFramework:
         warnings = []
         path_obj = Path(path).expanduser().resolve()
 
-        if not path_obj.exists():
+        # One stat() answers exists/is_file/size, and access() checks readability without
+        # opening the file.
+        try:
+            st = path_obj.stat()
+        except OSError as exc:
+            if exc.errno not in _MISSING_PATH_ERRNOS:
+                raise
             errors.append(f"File does not exist: {path_obj}")
-        elif not path_obj.is_file():
-            errors.append(f"Path is not a file: {path_obj}")
-        elif not path_obj.stat().st_size:
-            warnings.append(f"File is empty: {path_obj}")
-
-        if not errors:
-            try:
-                # Test readability
-                with path_obj.open("r", encoding="utf-8"):
-                    pass
-            except PermissionError:
-                errors.append(f"No read permission for file: {path_obj}")
-            except Exception as e:  # pragma: no cover - defensive
-                errors.append(f"Cannot read file {path_obj}: {e}")
+        else:
+            if not stat.S_ISREG(st.st_mode):
+                errors.append(f"Path is not a file: {path_obj}")
+            else:
+                if not st.st_size:
+                    warnings.append(f"File is empty: {path_obj}")
+                if not os.access(path_obj, os.R_OK):
+                    errors.append(f"No read permission for file: {path_obj}")
 
         result = ValidationResult(
             valid=len(errors) == 0,
@@ -94,9 +112,9 @@ class ValidationFramework:
         )
 
         if not result.valid:
-            self.logger.error(f"File validation failed: {result.errors}")
+            self.logger.error("File validation failed: %s", result.errors)
         elif result.has_warnings:
-            self.logger.warning(f"File validation warnings: {result.warnings}")
+            self.logger.warning("File validation warnings: %s", result.warnings)
 
         if self.strict and not result.valid:
             result.raise_if_invalid()
@@ -135,7 +153,7 @@ class ValidationFramework:
         )
 
         if not result.valid:
-            self.logger.error(f"Directory validation failed: {result.errors}")
+            self.logger.error("Directory validation failed: %s", result.errors)
 
         if self.strict and not result.valid:
             result.raise_if_invalid()
@@ -155,13 +173,13 @@ class ValidationFramework:
 
         path_obj = Path(path)
         try:
-            content = path_obj.read_text(encoding="utf-8")
+            content = path_obj.read_bytes()
             if not content.strip():
                 errors.append(f"JSON file is empty: {path}")
             else:
-                data = json.loads(content)
-                self.logger.info(f"Successfully loaded JSON from {path}")
-        except json.JSONDecodeError as e:
+                data = orjson.loads(content)
+                self.logger.info("Successfully loaded JSON from %s", path)
+        except orjson.JSONDecodeError as e:
             errors.append(f"Invalid JSON in {path}: {e}")
         except Exception as e:  # pragma: no cover - defensive
             errors.append(f"Error reading JSON file {path}: {e}")
@@ -169,7 +187,7 @@ class ValidationFramework:
         result = ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings, data=data)
 
         if not result.valid:
-            self.logger.error(f"JSON validation failed: {result.errors}")
+            self.logger.error("JSON validation failed: %s", result.errors)
 
         if self.strict and not result.valid:
             result.raise_if_invalid()
@@ -189,15 +207,15 @@ class ValidationFramework:
 
         path_obj = Path(path)
         try:
-            content = path_obj.read_text(encoding="utf-8")
+            content = path_obj.read_bytes()
             if not content.strip():
                 errors.append(f"YAML file is empty: {path}")
             else:
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YAML_LOADER)
                 if data is None:
                     warnings.append(f"YAML file contains only null/empty data: {path}")
                     data = {}
-                self.logger.info(f"Successfully loaded YAML from {path}")
+                self.logger.info("Successfully loaded YAML from %s", path)
         except yaml.YAMLError as e:
             errors.append(f"Invalid YAML in {path}: {e}")
         except Exception as e:  # pragma: no cover - defensive
@@ -206,9 +224,9 @@ class ValidationFramework:
         result = ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings, data=data)
 
         if not result.valid:
-            self.logger.error(f"YAML validation failed: {result.errors}")
+            self.logger.error("YAML validation failed: %s", result.errors)
         elif result.has_warnings:
-            self.logger.warning(f"YAML validation warnings: {result.warnings}")
+            self.logger.warning("YAML validation warnings: %s", result.warnings)
 
         if self.strict and not result.valid:
             result.raise_if_invalid()
@@ -226,29 +244,33 @@ class ValidationFramework:
             errors.append(f"Expected dict, got {type(data).__name__}")
             return ValidationResult(valid=False, errors=errors, warnings=warnings)
 
-        # Check required keys
-        missing = [key for key in required_keys if key not in data]
+        # Check required keys for presence and None values in one pass (lists keep the caller's order)
+        missing = []
+        null_required = []
+        for key in required_keys:
+            if key not in data:
+                missing.append(key)
+            elif data[key] is None:
+                null_required.append(key)
         if missing:
             errors.append(f"Missing required keys: {missing}")
 
         # Check for unknown keys
         if optional_keys is not None:
-            allowed = set(required_keys) | set(optional_keys)
+            allowed = {*required_keys, *optional_keys}
             unknown = [key for key in data if key not in allowed]
             if unknown:
                 warnings.append(f"Unknown keys (will be ignored): {unknown}")
 
-        # Check for None values in required keys
-        null_required = [key for key in required_keys if key in data and data[key] is None]
         if null_required:
             errors.append(f"Required keys with null values: {null_required}")
 
         result = ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings, data=data)
 
         if not result.valid:
-            self.logger.error(f"Dict structure validation failed: {result.errors}")
+            self.logger.error("Dict structure validation failed: %s", result.errors)
         elif result.has_warnings:
-            self.logger.warning(f"Dict structure warnings: {result.warnings}")
+            self.logger.warning("Dict structure warnings: %s", result.warnings)
 
         if self.strict and not result.valid:
             result.raise_if_invalid()
@@ -263,9 +285,10 @@ class ValidationFramework:
 
         try:
             validated_data = model_class(**data)
-            self.logger.info(f"Successfully validated against {model_class.__name__}")
+            self.logger.info("Successfully validated against %s", model_class.__name__)
         except ValidationError as e:
-            for error in e.errors():
+            # Only loc/msg are reported, so skip building the docs URL, ctx and input for each error.
+            for error in e.errors(include_url=False, include_context=False, include_input=False):
                 field = ".".join(str(loc) for loc in error["loc"])
                 errors.append(f"{field}: {error['msg']}")
         except Exception as e:
@@ -274,7 +297,7 @@ class ValidationFramework:
         result = ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings, data=validated_data)
 
         if not result.valid:
-            self.logger.error(f"Pydantic validation failed: {result.errors}")
+            self.logger.error("Pydantic validation failed: %s", result.errors)
 
         if self.strict and not result.valid:
             result.raise_if_invalid()
@@ -296,12 +319,12 @@ class ValidationFramework:
         """
 
         def decorator(func: F) -> F:
+            # Introspect once at decoration time; every call reuses the signature.
+            sig = inspect.signature(func)
+
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 # Map positional args to parameter names
-                import inspect
-
-                sig = inspect.signature(func)
                 bound = sig.bind(*args, **kwargs)
                 bound.apply_defaults()
 
@@ -311,7 +334,7 @@ class ValidationFramework:
                         value = bound.arguments[param_name]
                         result = validator(value)
                         if not result.valid:
-                            self.logger.error(f"Validation failed for {func.__name__}.{param_name}: {result.errors}")
+                            self.logger.error("Validation failed for %s.%s: %s", func.__name__, param_name, result.errors)
                             if self.strict:
                                 raise ValueError(f"Invalid {param_name}: {result.errors}")
 
@@ -343,12 +366,17 @@ class ValidationFramework:
                         last_exception = e
                         if attempt < max_retries:
                             self.logger.warning(
-                                f"Attempt {attempt + 1}/{max_retries + 1} failed for {func.__name__}: {e}. Retrying in {current_delay}s..."
+                                "Attempt %d/%d failed for %s: %s. Retrying in %ss...",
+                                attempt + 1,
+                                max_retries + 1,
+                                func.__name__,
+                                e,
+                                current_delay,
                             )
                             time.sleep(current_delay)
                             current_delay *= backoff
                         else:
-                            self.logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
+                            self.logger.error("All %d attempts failed for %s", max_retries + 1, func.__name__)
 
                 raise last_exception
 
@@ -370,50 +398,94 @@ class ValidationFramework:
         file_handle = None
 
         try:
-            self.logger.debug(f"Opening file {path} in mode {mode}")
+            self.logger.debug("Opening file %s in mode %s", path, mode)
             file_handle = path_obj.open(mode, encoding=encoding)
             yield file_handle
         except FileNotFoundError:
-            self.logger.error(f"File not found: {path}")
+            self.logger.error("File not found: %s", path)
             raise
         except PermissionError:
-            self.logger.error(f"Permission denied accessing file: {path}")
+            self.logger.error("Permission denied accessing file: %s", path)
             raise
         except Exception as e:
-            self.logger.error(f"Error accessing file {path}: {e}")
+            self.logger.error("Error accessing file %s: %s", path, e)
             raise
         finally:
             if file_handle:
                 try:
                     file_handle.close()
-                    self.logger.debug(f"Closed file {path}")
+                    self.logger.debug("Closed file %s", path)
                 except Exception as e:
-                    self.logger.warning(f"Error closing file {path}: {e}")
+                    self.logger.warning("Error closing file %s: %s", path, e)
 
     @contextmanager
     def timeout_protection(self, seconds: float, operation: str = "operation"):
         """Context manager for timeout protection.
 
+        Off the main thread the TimeoutError is injected asynchronously, so it cannot interrupt
+        a blocking C call (such as the socket read inside an LLM request) until that call returns.
+
         Example:
             with validation.timeout_protection(30.0, "LLM call"):
                 response = llm.generate(prompt)
         """
-        import signal
+        if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
 
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"{operation} timed out after {seconds} seconds")
-
-        # Set up timeout
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(int(seconds))
+            def timeout_handler(signum, frame):
+                raise TimeoutError(f"{operation} timed out after {seconds} seconds")
 
+            # setitimer keeps fractional seconds (alarm(int(0.5)) would disable the timeout).
+            old_handler = signal.signal(signal.SIGALRM, timeout_handler)
+            signal.setitimer(signal.ITIMER_REAL, seconds)
+            try:
+                yield
+            finally:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM, old_handler)
+            return
+
+        # Signals only reach the main thread (and SIGALRM is POSIX-only), so elsewhere a timer
+        # raises TimeoutError asynchronously in the guarded thread at its next bytecode boundary.
+        import ctypes
+
+        # SetAsyncExc instantiates the class with no arguments, so bake the message in to match
+        # the main-thread path.
+        class _OperationTimeout(TimeoutError):
+            def __init__(self) -> None:
+                super().__init__(f"{operation} timed out after {seconds} seconds")
+
+        thread_id = ctypes.c_ulong(threading.get_ident())
+        lock = threading.Lock()
+        active = True
+        fired = False
+
+        def interrupt() -> None:
+            nonlocal fired
+            with lock:
+                if active:
+                    fired = True
+                    self.logger.error("%s timed out after %s seconds", operation, seconds)
+                    ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, ctypes.py_object(_OperationTimeout))
+
+        timer = threading.Timer(seconds, interrupt)
+        timer.daemon = True
+        timer.start()
         try:
             yield
         finally:
-            # Disable alarm
-            signal.alarm(0)
-            # Restore old handler
-            signal.signal(signal.SIGALRM, old_handler)
+            # The async exception is only delivered at a bytecode boundary, so a timer that fires
+            # as the body finishes can land here instead. Disarm, then drop anything still pending
+            # so it cannot escape after the block.
+            while True:
+                try:
+                    with lock:
+                        active = False
+                    timer.cancel()
+                    if fired:
+                        ctypes.pythonapi.PyThreadState_SetAsyncExc(thread_id, None)
+                    break
+                except TimeoutError:
+                    continue
 
     # ============== Error Recovery ==============
 
@@ -431,9 +503,9 @@ class ValidationFramework:
             return primary()
         except Exception as e:
             if error_msg:
-                self.logger.warning(f"{error_msg}: {e}")
+                self.logger.warning("%s: %s", error_msg, e)
             else:
-                self.logger.warning(f"Primary operation failed, using fallback: {e}")
+                self.logger.warning("Primary operation failed, using fallback: %s", e)
             return fallback()
 
 
@@ -7,14 +7,13 @@ import os
 from pathlib import Path
 from typing import Dict
 
-from dotenv import load_dotenv
+import yaml
 
 from ccopilot.core.ablation import AblationConfig, parse_ablation_flag
-from ccopilot.core.config import PipelineConfig, load_course_constraints, load_pipeline_config
+from ccopilot.core.config import PipelineConfig, load_course_constraints, load_pipeline_config, read_yaml_file
 from ccopilot.core.dspy_runtime import DSPyConfigurationError, configure_dspy_models
 from ccopilot.core.provenance import ProvenanceEvent, ProvenanceLogger
-from ccopilot.core.validation import ValidationFailure, strict_validation, validate_handcrafted_dataset
-from scripts import ingest_handcrafted
+from ccopilot.core.validation import validate_handcrafted_dataset
 
 from .context import PipelineContext, PipelinePaths
 
@@ -74,6 +73,8 @@ def bootstrap_pipeline(
         ``config/scientific_config.yaml`` when present).
     """
 
+    from dotenv import load_dotenv  # deferred so importing the pipeline package stays light
+
     repo_root = (repo_root or Path.cwd()).resolve()
     dotenv_path = repo_root / ".env"
     load_dotenv(dotenv_path)  # make repo-scoped .env values available even when running elsewhere
@@ -137,45 +138,47 @@ def bootstrap_pipeline(
         science_config_path=science_config_resolved,
     )
 
-    if science_config is not None and science_config_resolved is not None:
+    # Bootstrap emits a handful of events before any stage runs; append them in one write.
+    with ctx.provenance.batch():
+        if science_config is not None and science_config_resolved is not None:
+            ctx.provenance.log(
+                ProvenanceEvent(
+                    stage="science_config",
+                    message="Scientific evaluation config loaded",
+                    agent="ccopilot.pipeline",
+                    payload={
+                        "path": str(science_config_resolved),
+                        "enabled": _science_config_enabled(science_config),
+                    },
+                )
+            )
+
+        try:
+            ctx.dspy_handles = configure_dspy_models(config.models)
+        except DSPyConfigurationError as exc:
+            raise RuntimeError("Unable to configure DSPy/OpenAI models") from exc
+
         ctx.provenance.log(
             ProvenanceEvent(
-                stage="science_config",
-                message="Scientific evaluation config loaded",
+                stage="bootstrap",
+                message="DSPy OpenAI models configured",
                 agent="ccopilot.pipeline",
                 payload={
-                    "path": str(science_config_resolved),
-                    "enabled": _science_config_enabled(science_config),
+                    "teacher_model": config.models.teacher_model,
+                    "ta_model": config.models.ta_model,
+                    "coder_model": config.models.coder.model,
+                    "student_model": config.models.student_model,
                 },
             )
         )
 
-    try:
-        ctx.dspy_handles = configure_dspy_models(config.models)
-    except DSPyConfigurationError as exc:
-        raise RuntimeError("Unable to configure DSPy/OpenAI models") from exc
-
-    ctx.provenance.log(
-        ProvenanceEvent(
-            stage="bootstrap",
-            message="DSPy OpenAI models configured",
-            agent="ccopilot.pipeline",
-            payload={
-                "teacher_model": config.models.teacher_model,
-                "ta_model": config.models.ta_model,
-                "coder_model": config.models.coder.model,
-                "student_model": config.models.student_model,
-            },
-        )
-    )
-
-    _ensure_dataset_exists(config.world_model.dataset_dir)
-    _ensure_notebook_export_dir(ctx.paths.output_dir)
-    if ctx.ablations.use_world_model:
-        _refresh_world_model_if_needed(ctx, ingest_before_run)
-    else:
-        LOGGER.info("World model ablated; skipping ingest and snapshot checks.")
-    _apply_notebook_env(ctx)
+        _ensure_dataset_exists(config.world_model.dataset_dir)
+        _ensure_notebook_export_dir(ctx.paths.output_dir)
+        if ctx.ablations.use_world_model:
+            _refresh_world_model_if_needed(ctx, ingest_before_run)
+        else:
+            LOGGER.info("World model ablated; skipping ingest and snapshot checks.")
+        _apply_notebook_env(ctx)
 
     return ctx
 
@@ -187,14 +190,15 @@ def _load_scientific_config(path: Path | None) -> tuple[Dict[str, object] | None
     if not resolved.exists():
         LOGGER.debug("Scientific config not found at %s; skipping", resolved)
         return None, None
+    # read_yaml_file shares the per-mtime parse cache with the pipeline/constraints loaders
+    # and rejects non-mapping documents itself.
     try:
-        result = strict_validation.validate_yaml_file(resolved)
-    except ValidationFailure as exc:  # pragma: no cover - defensive
+        payload = read_yaml_file(resolved)
+        # read_yaml_file maps an empty document to {}; a blank config file is still an error.
+        if not payload and not resolved.read_bytes().strip():
+            raise ValueError("YAML file is empty")
+    except (OSError, ValueError, yaml.YAMLError) as exc:
         raise RuntimeError(f"Invalid scientific config at {resolved}: {exc}") from exc
-
-    payload = result.data or {}
-    if not isinstance(payload, dict):
-        raise RuntimeError(f"Scientific config at {resolved} must be a mapping")
     return payload, resolved
 
 
@@ -231,8 +235,9 @@ def _ensure_notebook_export_dir(output_dir: Path) -> None:
 
 def _refresh_world_model_if_needed(ctx: PipelineContext, ingest_requested: bool) -> None:
     sqlite_path = ctx.config.world_model.sqlite_path
-    if ingest_requested or not sqlite_path.exists():
-        if not sqlite_path.exists():
+    store_exists = sqlite_path.exists()
+    if ingest_requested or not store_exists:
+        if not store_exists:
             LOGGER.info("World model store %s missing; ingesting fresh snapshot.", sqlite_path)
         _ingest_world_model(ctx)
     else:
@@ -240,6 +245,9 @@ def _refresh_world_model_if_needed(ctx: PipelineContext, ingest_requested: bool)
 
 
 def _ingest_world_model(ctx: PipelineContext) -> None:
+    # The ingest script pulls in csv/sqlite and the world-model store; only load it when a refresh runs.
+    from scripts import ingest_handcrafted
+
     dataset_dir = ctx.config.world_model.dataset_dir
     sqlite_path = ctx.config.world_model.sqlite_path
     snapshot_path = ctx.paths.artifacts_dir / "world_model_snapshot.jsonl"
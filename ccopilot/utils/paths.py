@@ -0,0 +1,23 @@
+"""Path resolution shared by the CLI entrypoints."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def resolve_path(value: str | Path, *, base: Path | None = None) -> Path:
+    """Expand ``~`` and resolve ``value``, anchoring relative paths at ``base`` (or the cwd)."""
+
+    # Joining drops the anchor for absolute values, and one resolve() of the joined path
+    # follows the same symlinks as resolving the anchor first, so a single call suffices.
+    # Not memoized: symlinks and the working directory can change between calls.
+    anchor = Path.cwd() if base is None else Path(base).expanduser()
+    return (anchor / Path(value).expanduser()).resolve()
+
+
+def resolve_optional(value: str | Path | None, *, base: Path | None = None) -> Path | None:
+    """Like :func:`resolve_path`, but pass ``None`` through."""
+
+    if value is None:
+        return None
+    return resolve_path(value, base=base)
@@ -4,10 +4,27 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import List
 
 DEFAULT_DELIMITERS = r"[;,]"
 
+# The default delimiters are single characters, so fold ';' into ',' and use str.split.
+_DEFAULT_TRANSLATION = str.maketrans(";", ",")
+
+
+@lru_cache(maxsize=32)
+def _compile_delimiters(delimiters: str) -> re.Pattern[str]:
+    return re.compile(delimiters)
+
+
+def _split_text(text: str, delimiters: str) -> List[str]:
+    if delimiters == DEFAULT_DELIMITERS:
+        raw_tokens = text.translate(_DEFAULT_TRANSLATION).split(",")
+    else:
+        raw_tokens = _compile_delimiters(delimiters).split(text)
+    return [token for token in (raw.strip() for raw in raw_tokens) if token]
+
 
 def split_fields(value: str | Sequence[str] | None, *, delimiters: str = DEFAULT_DELIMITERS) -> List[str]:
     """Split a CSV-like field into trimmed tokens.
@@ -21,10 +38,14 @@ def split_fields(value: str | Sequence[str] | None, *, delimiters: str = DEFAULT
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
         tokens: List[str] = []
         for item in value:
-            tokens.extend(split_fields(item, delimiters=delimiters))
+            if isinstance(item, str):
+                # Plain strings are split directly rather than re-entering split_fields.
+                if item:
+                    tokens.extend(_split_text(item, delimiters))
+            else:
+                tokens.extend(split_fields(item, delimiters=delimiters))
         return tokens
     text = str(value)
     if not text:
         return []
-    raw_tokens = re.split(delimiters, text)
-    return [token.strip() for token in raw_tokens if token.strip()]
+    return _split_text(text, delimiters)
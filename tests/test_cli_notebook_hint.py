@@ -53,3 +53,60 @@ def test_notebook_hint_lists_failure_counts_when_partial_success() -> None:
     text = buffer.getvalue()
     assert "[notebook] exported 1/2 sections" in text
     assert "1 error" in text
+
+
+def test_notebook_hint_derives_counts_without_summary() -> None:
+    artifacts = SimpleNamespace(
+        notebook_exports=[
+            {"kind": "preflight", "response": {"status": "ok"}},
+            {"response": {"status": "queued", "notebook_slug": "slug", "export_path": "b.md"}},
+            {"response": {"status": "queued", "export_path": "a.md"}},
+            {"response": {"status": "skipped", "reason": "offline"}},
+        ],
+    )
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        _print_notebook_hint(artifacts)
+
+    assert buffer.getvalue().strip() == "[notebook] exported 2/3 sections -> slug (queued at a.md, b.md)"
+
+
+def test_notebook_hint_counts_errors_and_skips_together() -> None:
+    artifacts = SimpleNamespace(
+        notebook_exports=[
+            {"response": {"status": "ok", "notebook": "slug"}},
+            {"response": {"status": "error"}},
+            {"response": {"status": "error"}},
+            {"response": {"status": "skipped"}},
+        ],
+    )
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        _print_notebook_hint(artifacts)
+
+    assert "(2 errors, 1 skipped; see manifest)" in buffer.getvalue()
+
+
+def test_notebook_hint_previews_first_note_ids_without_summary() -> None:
+    artifacts = SimpleNamespace(
+        notebook_exports=[{"response": {"status": "ok", "notebook": "slug", "note_id": f"n{idx}"}} for idx in range(6)],
+    )
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        _print_notebook_hint(artifacts)
+
+    assert buffer.getvalue().strip() == "[notebook] exported 6/6 sections -> slug (notes: n0, n1, n2, …)"
+
+
+def test_notebook_hint_caps_queued_path_preview_without_summary() -> None:
+    artifacts = SimpleNamespace(
+        notebook_exports=[
+            {"response": {"status": "queued", "notebook": "slug", "export_path": f"exports/{idx}.md"}} for idx in (6, 5, 4, 3, 2, 1, 5)
+        ],
+    )
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        _print_notebook_hint(artifacts)
+
+    expected = "(queued at exports/2.md, exports/3.md, exports/4.md, exports/5.md, exports/6.md, …)"
+    assert buffer.getvalue().strip().endswith(expected)
@@ -2,6 +2,8 @@ import io
 import json
 import os
 import shutil
+import subprocess
+import sys
 import tempfile
 import unittest
 from contextlib import ExitStack, redirect_stdout
@@ -9,14 +11,24 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import orjson
 import yaml
 
 from ccopilot.cli.run_poc import (
     REPO_ROOT,
+    _cached_parser,
+    _format_rubric_summary,
+    _format_score,
+    _load_eval_record,
     _print_artifact_summary,
+    _print_eval_summary,
     _print_highlight_hint,
     _print_scientific_summary,
     _print_stage_error_summary,
+    _read_science_config_from_manifest,
+    _read_stage_errors_from_manifest,
+    _set_env,
+    _sniff_mode,
     build_parser,
 )
 from ccopilot.cli.run_poc import (
@@ -266,6 +278,43 @@ evaluation:
         args = parser.parse_args([])
         self.assertEqual(args.repo_root, str(REPO_ROOT))
 
+    def test_sniff_mode_classifies_invocations(self) -> None:
+        self.assertEqual(_sniff_mode(["--help"]), "help")
+        self.assertEqual(_sniff_mode(["--dry-run", "-h"]), "help")
+        self.assertEqual(_sniff_mode(["--config", "x.yaml"]), "full")
+        self.assertEqual(_sniff_mode(["--dry-run", "--config", "x.yaml"]), "dry")
+        self.assertEqual(_sniff_mode(["--dry-run", "--notebook", "slug"]), "full")
+        self.assertEqual(_sniff_mode(["--dry-run", "--note=slug"]), "full")
+
+    def test_dry_parser_matches_full_parser_defaults(self) -> None:
+        argv = ["--dry-run", "--config", "config/pipeline.yaml"]
+        dry = build_parser("dry").parse_args(argv)
+        full = build_parser("full").parse_args(argv)
+        self.assertEqual(vars(dry), vars(full))
+
+    def test_cached_parser_reused_per_mode(self) -> None:
+        self.assertIs(_cached_parser("full"), _cached_parser("full"))
+        self.assertIsNot(_cached_parser("full"), _cached_parser("dry"))
+
+    def test_cli_help_does_not_import_pipeline(self) -> None:
+        probe = (
+            "import sys\n"
+            "from ccopilot.cli import run_poc\n"
+            "try:\n"
+            "    run_poc.main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('ccopilot.pipeline' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=str(REPO_ROOT),
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertTrue(result.stdout.strip().endswith("False"))
+
     def test_cli_run_produces_artifacts(self) -> None:
         exit_code, output, output_dir = self._run_cli()
         self.assertEqual(exit_code, 0)
@@ -335,6 +384,105 @@ evaluation:
         preview_id = summary["note_ids"][0]
         self.assertIn(preview_id, output, "CLI notebook hint should surface note IDs")
 
+    def test_manifest_json_parsed_once_until_file_changes(self) -> None:
+        manifest_path = self.repo_root / "cached_manifest.json"
+        manifest_path.write_text(json.dumps({"science_config_path": "a.yaml", "stage_errors": []}), encoding="utf-8")
+
+        with patch("ccopilot.cli.run_poc.orjson.loads", wraps=orjson.loads) as mock_loads:
+            self.assertEqual(_read_science_config_from_manifest(manifest_path), Path("a.yaml"))
+            self.assertEqual(_read_stage_errors_from_manifest(manifest_path), [])
+            self.assertEqual(mock_loads.call_count, 1)
+
+            manifest_path.write_text(json.dumps({"science_config_path": "b.yaml"}), encoding="utf-8")
+            stat = manifest_path.stat()
+            os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(_read_science_config_from_manifest(manifest_path), Path("b.yaml"))
+            self.assertEqual(mock_loads.call_count, 2)
+
+            # Same mtime, different size: still re-parsed.
+            stat = manifest_path.stat()
+            manifest_path.write_text(json.dumps({"science_config_path": "longer.yaml"}), encoding="utf-8")
+            os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(_read_science_config_from_manifest(manifest_path), Path("longer.yaml"))
+            self.assertEqual(mock_loads.call_count, 3)
+
+    def test_set_env_only_writes_changed_values(self) -> None:
+        writes: list[tuple[str, str]] = []
+
+        class RecordingEnviron(dict):
+            def __setitem__(self, key: str, value: str) -> None:
+                writes.append((key, value))
+                super().__setitem__(key, value)
+
+        environ = RecordingEnviron(COURSEGEN_REPO_ROOT="/repo")
+        with patch("ccopilot.cli.run_poc.os.environ", environ):
+            _set_env("COURSEGEN_REPO_ROOT", "/repo")
+            self.assertEqual(writes, [])
+            _set_env("COURSEGEN_REPO_ROOT", "/other")
+        self.assertEqual(writes, [("COURSEGEN_REPO_ROOT", "/other")])
+
+    def test_format_score_handles_numbers_and_placeholders(self) -> None:
+        self.assertEqual(_format_score(0.5), "0.500")
+        self.assertEqual(_format_score(3), "3.000")
+        self.assertEqual(_format_score(True), "1.000")
+        self.assertEqual(_format_score(None), "n/a")
+        self.assertEqual(_format_score("pending"), "pending")
+        self.assertEqual(_format_score(["a"]), "['a']")
+
+    def test_format_rubric_summary_lists_each_rubric(self) -> None:
+        rubrics = [{"name": "Pedagogy", "passed": True, "score": 0.9}, {"passed": False}]
+        self.assertEqual(_format_rubric_summary(rubrics), "Pedagogy:PASS(0.900), ?:FAIL(n/a)")
+        self.assertEqual(_format_rubric_summary([]), "no rubrics")
+
+    def test_cli_emits_summary_with_single_write(self) -> None:
+        artifacts = SimpleNamespace(
+            eval_report=self.repo_root / "missing_eval.jsonl",
+            highlights=None,
+            highlight_source="dataset",
+            manifest=None,
+            course_plan=self.repo_root / "course_plan.md",
+        )
+        writes: list[str] = []
+
+        class RecordingStream(io.StringIO):
+            def write(self, text: str) -> int:
+                writes.append(text)
+                return super().write(text)
+
+        with (
+            patch("ccopilot.cli.run_poc.bootstrap_pipeline", return_value=object()),
+            patch("ccopilot.cli.run_poc.run_pipeline", return_value=artifacts),
+            redirect_stdout(RecordingStream()),
+        ):
+            exit_code = cli_main(["--repo-root", str(self.repo_root), "--config", "config/pipeline.yaml"])
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(writes), 1)
+        self.assertIn("[eval] report missing", writes[0])
+        self.assertIn("[artifacts] course_plan=", writes[0])
+
+    def test_eval_summary_reports_missing_report(self) -> None:
+        missing = self.repo_root / "no_such_eval.jsonl"
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            _print_eval_summary(SimpleNamespace(eval_report=missing))
+        self.assertEqual(buffer.getvalue().strip(), f"[eval] report missing at {missing}")
+
+    def test_manifest_json_tolerates_file_removed_after_stat(self) -> None:
+        manifest_path = self.repo_root / "vanishing_manifest.json"
+        manifest_path.write_text("{}", encoding="utf-8")
+        with patch.object(Path, "read_bytes", side_effect=FileNotFoundError):
+            self.assertEqual(_read_stage_errors_from_manifest(manifest_path), [])
+
+    def test_load_eval_record_reads_first_record_only(self) -> None:
+        report = self.repo_root / "multi_eval.jsonl"
+        report.write_text('{"overall_score": 0.5}\n{"overall_score": 0.9}\nnot json\n', encoding="utf-8")
+        self.assertEqual(_load_eval_record(report), {"overall_score": 0.5})
+
+        report.write_text("", encoding="utf-8")
+        with self.assertRaisesRegex(ValueError, "empty evaluation file"):
+            _load_eval_record(report)
+
     def test_stage_error_summary_prints_when_manifest_contains_errors(self) -> None:
         manifest_path = self.repo_root / "stage_manifest.json"
         manifest_path.write_text(
@@ -351,7 +499,7 @@ evaluation:
         artifacts = SimpleNamespace(manifest=manifest_path)
         buffer = io.StringIO()
         with redirect_stdout(buffer):
-            _print_stage_error_summary(artifacts, quiet=False)
+            _print_stage_error_summary(artifacts)
 
         output = buffer.getvalue()
         self.assertIn("[stage-errors] 2 issue(s)", output)
@@ -434,8 +582,10 @@ evaluation:
         self.assertEqual(payload["status"], "students_disabled")
 
     def test_cli_quiet_suppresses_summaries(self) -> None:
-        exit_code, output, output_dir = self._run_cli(["--quiet"])
+        with patch("ccopilot.cli.run_poc._load_eval_record") as mock_eval:
+            exit_code, output, output_dir = self._run_cli(["--quiet"])
         self.assertEqual(exit_code, 0)
+        mock_eval.assert_not_called()
         self.assertTrue((output_dir / "course_plan.md").exists())
         self.assertNotIn("[eval]", output)
         self.assertNotIn("[highlights]", output)
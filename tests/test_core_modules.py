@@ -1,16 +1,30 @@
+import inspect
 import json
+import os
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import yaml
+from pydantic import ValidationError
 
 from ccopilot.core.ablation import AblationConfig, parse_ablation_flag
 from ccopilot.core.config import (
+    DISABLE_CONFIG_CACHE_ENV,
     CourseConstraints,
+    ModelConfig,
     PipelineConfig,
     load_course_constraints,
     load_pipeline_config,
+    merge_course_constraints,
+    read_yaml_file,
 )
 from ccopilot.core.provenance import ProvenanceLogger
+from ccopilot.core.validation import ValidationFailure, ValidationFramework, ValidationResult
 
 
 class ConfigParsingTests(unittest.TestCase):
@@ -65,6 +79,86 @@ class ConfigParsingTests(unittest.TestCase):
         self.assertEqual(config.models.default_temperature, 1.0)
         self.assertEqual(config.models.default_max_tokens, 32000)
 
+    def test_read_yaml_file_handles_empty_and_non_mapping_documents(self) -> None:
+        self.assertEqual(read_yaml_file(self._write_yaml("")), {})
+        self.assertEqual(read_yaml_file(self._write_yaml("title: DBS\nweeks: 4\n")), {"title": "DBS", "weeks": 4})
+        with self.assertRaises(ValueError):
+            read_yaml_file(self._write_yaml("- just\n- a list\n"))
+
+    def test_read_yaml_file_caches_parse_until_file_changes(self) -> None:
+        path = self._write_yaml("title: DBS\n")
+        with mock.patch("ccopilot.core.config.yaml.load", wraps=yaml.load) as mock_load:
+            first = read_yaml_file(path)
+            first["title"] = "mutated"
+            self.assertEqual(read_yaml_file(path), {"title": "DBS"})
+            self.assertEqual(mock_load.call_count, 1)
+
+            path.write_text("title: Databases\n", encoding="utf-8")
+            self.assertEqual(read_yaml_file(path), {"title": "Databases"})
+            self.assertEqual(mock_load.call_count, 2)
+
+            with mock.patch.dict(os.environ, {DISABLE_CONFIG_CACHE_ENV: "1"}):
+                read_yaml_file(path)
+            self.assertEqual(mock_load.call_count, 3)
+
+    def test_course_constraints_strip_list_fields_without_mutating_input(self) -> None:
+        payload = {
+            "title": "DBS",
+            "duration_weeks": 4,
+            "audience": {"persona": "grad"},
+            "focus_areas": [" sql "],
+            "required_sources": [" a "],
+            "banned_sources": [],
+            "learning_objectives": [" b"],
+        }
+        constraints = CourseConstraints.model_validate(payload)
+        self.assertEqual(constraints.focus_areas, ["sql"])
+        self.assertEqual(constraints.required_sources, ["a"])
+        self.assertEqual(constraints.learning_objectives, ["b"])
+        self.assertEqual(payload["focus_areas"], [" sql "])
+
+    def test_merge_course_constraints_validates_only_overrides(self) -> None:
+        base = CourseConstraints(title="DBS", duration_weeks=4, audience={"persona": "grad"}, focus_areas=["sql"])
+        merged = merge_course_constraints(base, {"duration_weeks": 6, "required_sources": [" paper "], "unknown": 1})
+
+        self.assertEqual(merged.duration_weeks, 6)
+        self.assertEqual(merged.required_sources, ["paper"])
+        self.assertEqual(merged.focus_areas, ["sql"])
+        self.assertEqual(base.duration_weeks, 4)
+        self.assertEqual(base.required_sources, [])
+        with self.assertRaises(ValueError):
+            merge_course_constraints(base, {"duration_weeks": 100})
+        self.assertEqual(base.duration_weeks, 4)
+
+    def test_load_pipeline_config_resolves_relative_paths_against_base_dir(self) -> None:
+        path = self._write_yaml(
+            """
+            course:
+              title: DBS
+              duration_weeks: 4
+              audience:
+                persona: undergrad
+            notebook:
+              api_base: http://localhost:5055
+            world_model:
+              schema_path: ../schemas/./schema.sql
+              dataset_dir: data
+            evaluation:
+              rubrics_path: evals/rubrics.yaml
+            """
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir) / "repo"
+            config = load_pipeline_config(path, base_dir=base_dir)
+            expected_root = base_dir.resolve()
+            self.assertEqual(config.world_model.schema_path, expected_root.parent / "schemas" / "schema.sql")
+            self.assertEqual(config.world_model.dataset_dir, expected_root / "data")
+            self.assertEqual(config.evaluation.rubrics_path, expected_root / "evals" / "rubrics.yaml")
+
+    def test_pipeline_config_reports_all_missing_sections(self) -> None:
+        with self.assertRaisesRegex(ValidationError, "Missing config sections: notebook, world_model"):
+            PipelineConfig.model_validate({"course": {}})
+
     def test_load_pipeline_config_promotes_legacy_model_fields(self) -> None:
         path = self._write_yaml(
             """
@@ -94,6 +188,16 @@ class ConfigParsingTests(unittest.TestCase):
         self.assertEqual(config.models.default_temperature, 0.42)
         self.assertEqual(config.models.default_max_tokens, 4096)
 
+    def test_model_config_flattens_models_block_and_plural_roles(self) -> None:
+        payload = {"models": {"teacher": {"model": "t"}, "teaching_assistants": {"model": "ta-x"}}, "extra": 1}
+        models = ModelConfig.model_validate(payload)
+
+        self.assertEqual(models.teacher.model, "t")
+        self.assertEqual(models.ta.model, "ta-x")
+        self.assertEqual(models.student.model, "ta-x")
+        self.assertEqual(models.coder.model, "gpt-5.1-codex-mini")
+        self.assertIn("models", payload)
+
 
 class AblationParsingTests(unittest.TestCase):
     def test_parse_ablation_flag(self) -> None:
@@ -106,6 +210,19 @@ class AblationParsingTests(unittest.TestCase):
         cfg = parse_ablation_flag(None)
         self.assertEqual(cfg, AblationConfig())
 
+    def test_ablation_config_is_immutable(self) -> None:
+        cfg = parse_ablation_flag("no_students")
+        with self.assertRaises(ValidationError):
+            cfg.use_students = True  # type: ignore[misc]
+        self.assertTrue(cfg.model_copy(update={"use_students": True}).use_students)
+
+    def test_parse_ablation_flag_normalizes_and_rejects_unknown(self) -> None:
+        cfg = parse_ablation_flag(" NO_Recursion , ,")
+        self.assertFalse(cfg.allow_recursion)
+        self.assertTrue(cfg.use_world_model)
+        with self.assertRaisesRegex(ValueError, "Unknown ablation 'bogus'. Valid options: no_world_model, no_students, no_recursion"):
+            parse_ablation_flag("no_students,bogus")
+
 
 class ProvenanceLoggerTests(unittest.TestCase):
     def test_log_event(self) -> None:
@@ -124,6 +241,170 @@ class ProvenanceLoggerTests(unittest.TestCase):
             data = json.loads(contents)
             self.assertEqual(data["stage"], "unit-test")
 
+    def test_extend_writes_batch_in_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "prov.jsonl"
+            logger = ProvenanceLogger(path)
+            logger.log({"stage": "first", "message": "ok"})
+            logger.extend([{"stage": "second", "message": "ok"}, {"stage": "third", "message": "ok", "agent": "ta"}])
+            logger.extend([])
+
+            records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual([record["stage"] for record in records], ["first", "second", "third"])
+            self.assertEqual(records[2]["agent"], "ta")
+
+            with self.assertRaises(ValidationError):
+                logger.extend([{"stage": "fourth", "message": "ok"}, {"stage": "broken"}])
+            self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 3)
+
+    def test_batch_defers_log_writes_until_exit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "prov.jsonl"
+            logger = ProvenanceLogger(path)
+            with self.assertRaises(RuntimeError):
+                with logger.batch():
+                    event = logger.log({"stage": "a", "message": "ok"})
+                    with logger.batch():
+                        logger.log({"stage": "b", "message": "ok"})
+                    self.assertFalse(path.exists())
+                    raise RuntimeError("stage failed")
+            self.assertEqual(event.stage, "a")
+
+            logger.log({"stage": "c", "message": "ok"})
+            stages = [json.loads(line)["stage"] for line in path.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual(stages, ["a", "b", "c"])
+
+
+class ValidateInputsTests(unittest.TestCase):
+    def test_validate_inputs_binds_positional_and_default_args(self) -> None:
+        framework = ValidationFramework(strict=True)
+        seen: list[Any] = []
+
+        def check(value: Any) -> ValidationResult:
+            seen.append(value)
+            return ValidationResult(valid=value > 0, errors=[] if value > 0 else ["must be positive"], warnings=[])
+
+        @framework.validate_inputs(count=check, limit=check)
+        def scale(count: int, limit: int = 5) -> int:
+            return count * limit
+
+        with mock.patch("ccopilot.core.validation.inspect.signature", wraps=inspect.signature) as mock_signature:
+            self.assertEqual(scale(2), 10)
+            self.assertEqual(scale(3, limit=2), 6)
+            mock_signature.assert_not_called()
+        self.assertEqual(seen, [2, 5, 3, 2])
+        with self.assertRaisesRegex(ValueError, "Invalid count"):
+            scale(-1)
+
+
+class TimeoutProtectionTests(unittest.TestCase):
+    def test_sub_second_timeout_on_main_thread(self) -> None:
+        framework = ValidationFramework(strict=False)
+        with self.assertRaisesRegex(TimeoutError, "spin timed out after 0.05 seconds"):
+            with framework.timeout_protection(0.05, "spin"):
+                time.sleep(1)
+
+    def test_timeout_in_worker_thread(self) -> None:
+        framework = ValidationFramework(strict=False)
+        outcome: list[str] = []
+
+        def worker() -> None:
+            try:
+                with framework.timeout_protection(0.05, "spin"):
+                    deadline = time.monotonic() + 2
+                    while time.monotonic() < deadline:
+                        pass
+                outcome.append("finished")
+            except TimeoutError as exc:
+                outcome.append(str(exc))
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join(5)
+        self.assertEqual(outcome, ["spin timed out after 0.05 seconds"])
+
+    def test_fast_block_is_not_interrupted(self) -> None:
+        framework = ValidationFramework(strict=False)
+        with framework.timeout_protection(0.05, "quick"):
+            pass
+        time.sleep(0.1)
+
+
+class ValidationFileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+        self.framework = ValidationFramework(strict=False)
+
+    def test_validate_file_exists_classifies_paths(self) -> None:
+        with self.assertLogs("ccopilot.core.validation", level="ERROR") as logs:
+            missing = self.framework.validate_file_exists(self.root / "missing.yaml")
+        self.assertIn("File does not exist", missing.errors[0])
+        self.assertEqual(logs.records[0].getMessage(), f"File validation failed: {missing.errors}")
+        under_file = self.root / "plain.txt"
+        under_file.write_text("x", encoding="utf-8")
+        self.assertIn("File does not exist", self.framework.validate_file_exists(under_file / "child").errors[0])
+        self.assertIn("Path is not a file", self.framework.validate_file_exists(self.root).errors[0])
+
+        empty = self.root / "empty.yaml"
+        empty.touch()
+        result = self.framework.validate_file_exists(empty)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.data, empty.resolve())
+        self.assertIn("File is empty", result.warnings[0])
+
+        with self.assertRaises(ValidationFailure):
+            ValidationFramework(strict=True).validate_file_exists(self.root / "missing.yaml")
+
+    def test_validate_dict_structure_reports_missing_null_and_unknown_keys(self) -> None:
+        result = self.framework.validate_dict_structure(
+            {"model": None, "extra": 1, "temperature": 0.2},
+            ["model", "provider", "api"],
+            optional_keys=["temperature"],
+        )
+        self.assertEqual(
+            result.errors,
+            ["Missing required keys: ['provider', 'api']", "Required keys with null values: ['model']"],
+        )
+        self.assertEqual(result.warnings, ["Unknown keys (will be ignored): ['extra']"])
+        self.assertTrue(self.framework.validate_dict_structure({"model": "m"}, ["model"]).valid)
+        self.assertFalse(self.framework.validate_dict_structure(["model"], ["model"]).valid)
+
+    def test_validate_pydantic_model_reports_field_errors(self) -> None:
+        result = self.framework.validate_pydantic_model({"title": "DBS", "duration_weeks": "many"}, CourseConstraints)
+        self.assertFalse(result.valid)
+        self.assertIn("duration_weeks: Input should be a valid integer, unable to parse string as an integer", result.errors)
+        self.assertIn("audience: Field required", result.errors)
+
+    def test_validate_json_file_loads_and_reports_bad_content(self) -> None:
+        good = self.root / "good.json"
+        good.write_text('{"title": "Café", "weeks": [1, 2]}', encoding="utf-8")
+        self.assertEqual(self.framework.validate_json_file(good).data, {"title": "Café", "weeks": [1, 2]})
+
+        empty = self.root / "empty.json"
+        empty.write_text("  \n", encoding="utf-8")
+        self.assertIn("JSON file is empty", self.framework.validate_json_file(empty).errors[0])
+
+        broken = self.root / "broken.json"
+        broken.write_text("{", encoding="utf-8")
+        self.assertIn("Invalid JSON", self.framework.validate_json_file(broken).errors[0])
+
+    def test_validate_yaml_file_loads_and_reports_bad_content(self) -> None:
+        good = self.root / "good.yaml"
+        good.write_text("title: Café\nweeks: [1, 2]\n", encoding="utf-8")
+        self.assertEqual(self.framework.validate_yaml_file(good).data, {"title": "Café", "weeks": [1, 2]})
+
+        null_doc = self.root / "null.yaml"
+        null_doc.write_text("~\n", encoding="utf-8")
+        result = self.framework.validate_yaml_file(null_doc)
+        self.assertEqual(result.data, {})
+        self.assertTrue(result.has_warnings)
+
+        broken = self.root / "broken.yaml"
+        broken.write_text("key: [unclosed\n", encoding="utf-8")
+        self.assertIn("Invalid YAML", self.framework.validate_yaml_file(broken).errors[0])
+
 
 if __name__ == "__main__":
     unittest.main()
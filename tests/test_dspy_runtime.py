@@ -20,7 +20,8 @@ class ConfigureDSPyModelsTests(unittest.TestCase):
         handles = configure_dspy_models(self.model_cfg, api_key="sk-test")
 
         self.assertIsInstance(handles, DSPyModelHandles)
-        self.assertEqual(mock_dspy.OpenAI.call_count, 4)
+        # The default ta and student roles resolve identically and share one handle.
+        self.assertEqual(mock_dspy.OpenAI.call_count, 3)
         mock_dspy.settings.configure.assert_called_once_with(lm=mock_dspy.OpenAI.return_value)
 
     @mock.patch("ccopilot.core.dspy_runtime.dspy")
@@ -29,9 +30,17 @@ class ConfigureDSPyModelsTests(unittest.TestCase):
         handles = configure_dspy_models(self.model_cfg, api_key="sk-test")
 
         self.assertIsInstance(handles, DSPyModelHandles)
-        self.assertEqual(mock_dspy.LM.call_count, 4)
+        self.assertEqual(mock_dspy.LM.call_count, 3)
         mock_dspy.settings.configure.assert_called_once()
 
+    @mock.patch("ccopilot.core.dspy_runtime.dspy")
+    def test_configure_default_false_leaves_global_lm_alone(self, mock_dspy) -> None:
+        mock_dspy.OpenAI = mock.Mock()
+        handles = configure_dspy_models(self.model_cfg, api_key="sk-test", configure_default=False)
+
+        self.assertIs(handles.teacher, mock_dspy.OpenAI.return_value)
+        mock_dspy.settings.configure.assert_not_called()
+
     def test_missing_api_key_raises(self) -> None:
         previous = os.environ.pop("OPENAI_API_KEY", None)
         try:
@@ -69,16 +78,42 @@ class ConfigureDSPyModelsTests(unittest.TestCase):
         self.assertEqual(coder_kwargs["api_key"], "sk-student")
         self.assertEqual(student_kwargs["api_key"], "sk-student")
 
+    @mock.patch("ccopilot.core.dspy_runtime.dspy")
+    def test_identical_roles_share_lm_handle(self, mock_dspy) -> None:
+        mock_dspy.OpenAI = mock.Mock(side_effect=lambda **kwargs: mock.Mock(kwargs=kwargs))
+        cfg = ModelConfig(
+            ta={"provider": "openai", "model": "gpt-4o-mini", "reasoning": {"effort": "low"}},
+            student={"provider": "openai", "model": "gpt-4o-mini", "reasoning": {"effort": "low"}},
+            coder={"provider": "openai", "model": "gpt-4o-mini", "temperature": 0.2},
+        )
+        handles = configure_dspy_models(cfg, api_key="sk-test")
+
+        self.assertIs(handles.ta, handles.student)
+        self.assertIsNot(handles.ta, handles.coder)
+        self.assertIsNot(handles.ta, handles.teacher)
+        self.assertEqual(mock_dspy.OpenAI.call_count, 3)
+
     @mock.patch("ccopilot.core.dspy_runtime.dspy")
     def test_openai_api_base_env_applied(self, mock_dspy) -> None:
         mock_dspy.OpenAI = mock.Mock()
         with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk", "OPENAI_API_BASE": "https://proxy"}, clear=True):
             configure_dspy_models(self.model_cfg)
 
-        self.assertEqual(len(mock_dspy.OpenAI.call_args_list), 4)
+        self.assertEqual(len(mock_dspy.OpenAI.call_args_list), 3)
         for call in mock_dspy.OpenAI.call_args_list:
             self.assertEqual(call.kwargs.get("api_base"), "https://proxy")
 
+    @mock.patch("ccopilot.core.dspy_runtime.dspy")
+    def test_role_specific_api_base_env_wins_over_generic(self, mock_dspy) -> None:
+        mock_dspy.OpenAI = mock.Mock()
+        cfg = ModelConfig(coder={"provider": "openai", "model": "gpt-4o", "api_base_env": "CODER_BASE"})
+        env = {"OPENAI_API_KEY": "sk", "OPENAI_API_BASE": "https://shared", "OPENAI_API_BASE_TEACHER": "https://teacher", "CODER_BASE": "https://coder"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            configure_dspy_models(cfg)
+
+        bases = [call.kwargs.get("api_base") for call in mock_dspy.OpenAI.call_args_list]
+        self.assertEqual(bases, ["https://teacher", "https://shared", "https://coder"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -310,7 +310,7 @@ def test_world_model_hooks_return_concepts(tmp_path: Path, dataset_summary: dict
 
 def test_world_model_hooks_handle_disabled_mode(tmp_path: Path, dataset_summary: dict[str, object]) -> None:
     ctx = _make_context(tmp_path)
-    ctx.ablations.use_world_model = False
+    ctx.ablations = ctx.ablations.model_copy(update={"use_world_model": False})
     orch = TeacherOrchestrator(ctx)
     orch.teacher_rlm = TeacherRLM()
     hooks = orch._build_teacher_hooks(world_model_highlights={})
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+from ccopilot.utils.paths import resolve_optional, resolve_path
+
+
+def test_resolve_path_tracks_working_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.chdir(first)
+    assert resolve_path("config.yaml") == first.resolve() / "config.yaml"
+    monkeypatch.chdir(second)
+    assert resolve_path("config.yaml") == second.resolve() / "config.yaml"
+    assert resolve_path("config.yaml", base=first) == first.resolve() / "config.yaml"
+
+
+def test_resolve_path_follows_symlinked_base_before_parent_refs(tmp_path: Path) -> None:
+    real = tmp_path / "real" / "repo"
+    real.mkdir(parents=True)
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+
+    assert resolve_path("../data", base=link) == real.resolve().parent / "data"
+    assert resolve_path(real / "x.yaml", base=link) == real.resolve() / "x.yaml"
+
+    other = tmp_path / "other"
+    other.mkdir()
+    link.unlink()
+    link.symlink_to(other, target_is_directory=True)
+    assert resolve_path("x.yaml", base=link) == other.resolve() / "x.yaml"
+
+
+def test_resolve_optional_passes_none_through(tmp_path: Path) -> None:
+    assert resolve_optional(None, base=tmp_path) is None
+    assert resolve_optional("a.yaml", base=tmp_path) == tmp_path.resolve() / "a.yaml"
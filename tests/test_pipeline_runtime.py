@@ -1,6 +1,8 @@
 import json
 import os
 import shutil
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -11,9 +13,11 @@ from unittest import mock
 import yaml
 
 from agents.teacher_rlm import TeacherActionRecord, TeacherRLMRun
+from ccopilot.core import provenance as provenance_module
 from ccopilot.core.config import read_yaml_file
 from ccopilot.core.dspy_runtime import DSPyModelHandles
 from ccopilot.pipeline import bootstrap_pipeline, run_pipeline
+from ccopilot.pipeline.bootstrap import _load_scientific_config
 from tests.mocks.notebook_api import NotebookAPIMock
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -556,6 +560,43 @@ evaluation:
         self.assertIsNone(manifest.get("scientific_metrics_artifact"))
         self.assertEqual(manifest.get("science_config_path"), str(science_cfg.resolve()))
 
+    def test_bootstrap_appends_provenance_events_in_one_write(self) -> None:
+        with mock.patch("ccopilot.core.provenance._append", wraps=provenance_module._append) as mock_append:
+            ctx = bootstrap_pipeline(config_path=self.config_path, repo_root=self.repo_root, output_dir=self.output_dir)
+
+        self.assertEqual(mock_append.call_count, 1)
+        lines = (ctx.paths.logs_dir / "provenance.jsonl").read_text(encoding="utf-8").splitlines()
+        messages = [json.loads(line)["message"] for line in lines]
+        self.assertIn("DSPy OpenAI models configured", messages)
+
+    def test_importing_bootstrap_defers_dotenv_and_ingest(self) -> None:
+        probe = (
+            "import sys, ccopilot.pipeline.bootstrap; "
+            "print(any(name in sys.modules for name in ('dotenv', 'scripts.ingest_handcrafted')))"
+        )
+        result = subprocess.run([sys.executable, "-c", probe], cwd=str(PROJECT_ROOT), capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False")
+
+    def test_load_scientific_config_returns_private_payload(self) -> None:
+        science_cfg = self.repo_root / "science.yaml"
+        science_cfg.write_text("enabled: true\nmetrics: [blooms]\n", encoding="utf-8")
+
+        payload, resolved = _load_scientific_config(science_cfg)
+        self.assertEqual(resolved, science_cfg.resolve())
+        assert payload is not None
+        payload["metrics"].append("mutated")
+        self.assertEqual(_load_scientific_config(science_cfg)[0], {"enabled": True, "metrics": ["blooms"]})
+        self.assertEqual(_load_scientific_config(self.repo_root / "missing.yaml"), (None, None))
+
+        science_cfg.write_text("- not\n- a mapping\n", encoding="utf-8")
+        with self.assertRaisesRegex(RuntimeError, "Invalid scientific config"):
+            _load_scientific_config(science_cfg)
+
+        science_cfg.write_text("  \n", encoding="utf-8")
+        with self.assertRaisesRegex(RuntimeError, "empty"):
+            _load_scientific_config(science_cfg)
+
     def test_missing_dataset_dir_raises(self) -> None:
         dataset_dir = self.repo_root / "data"
         if dataset_dir.exists():
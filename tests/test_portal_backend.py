@@ -5,15 +5,25 @@ import os
 from pathlib import Path
 from typing import Iterator
 
+import anyio
+import anyio.to_thread
 import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from apps.portal_backend import main as portal_main
 from apps.portal_backend.main import (
     PortalSettings,
+    _build_settings,
     _derive_highlight_source,
     _derive_world_model_store_exists,
+    _extract_run_id,
+    _lifespan,
+    _load_manifest,
+    _read_excerpt,
+    _timestamp_for,
     app,
+    collect_trace_files,
     get_settings,
 )
 
@@ -550,6 +560,26 @@ def test_runs_endpoint_supports_pagination(portal_settings: PortalSettings) -> N
     assert invalid.status_code == 422
 
 
+def test_runs_page_builds_only_requested_rows(portal_settings: PortalSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    for day in ("01", "02", "03", "04"):
+        _write_run(portal_settings.outputs_dir, run_id=f"202501{day}-000000")
+    built: list[str] = []
+    original = portal_main._build_run_list_item
+
+    def tracking(settings: PortalSettings, manifest_path: Path, stat: os.stat_result):
+        built.append(manifest_path.name)
+        return original(settings, manifest_path, stat)
+
+    monkeypatch.setattr(portal_main, "_build_run_list_item", tracking)
+    client = TestClient(app)
+    runs = client.get("/runs", params={"limit": 1, "offset": 1}).json()
+    assert [run["run_id"] for run in runs] == ["20250103-000000"]
+    assert built == ["run-20250103-000000-manifest.json"]
+
+    client.get("/runs", params={"limit": 1, "offset": 1})
+    assert len(built) == 1
+
+
 def test_run_detail_prefers_export_notebook_slug(portal_settings: PortalSettings) -> None:
     _write_run(
         portal_settings.outputs_dir,
@@ -706,3 +736,352 @@ def test_rejects_paths_outside_workspace(portal_settings: PortalSettings) -> Non
 
     response = client.get(f"/runs/{run_id}/course-plan")
     assert response.status_code == 400
+
+
+def test_resolve_path_rechecks_swapped_symlinks(portal_settings: PortalSettings, tmp_path: Path) -> None:
+    settings = portal_settings
+    lectures = settings.outputs_dir / "lectures"
+    lectures.mkdir(parents=True, exist_ok=True)
+    assert settings.resolve_path("lectures/module_01.md") == settings.outputs_root / "lectures" / "module_01.md"
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    lectures.rmdir()
+    lectures.symlink_to(outside, target_is_directory=True)
+    with pytest.raises(HTTPException) as excinfo:
+        settings.resolve_path("lectures/module_01.md")
+    assert excinfo.value.status_code == 400
+
+
+def test_runs_and_detail_honor_if_none_match(portal_settings: PortalSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(portal_main, "_RUNS_CACHE_TTL_SECONDS", 0.0)
+    run_id = "20250106-000000"
+    _write_run(portal_settings.outputs_dir, run_id=run_id)
+    client = TestClient(app)
+
+    runs_resp = client.get("/runs")
+    etag = runs_resp.headers["etag"]
+    cached = client.get("/runs", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    detail_resp = client.get(f"/runs/{run_id}")
+    detail_etag = detail_resp.headers["etag"]
+    assert client.get(f"/runs/{run_id}", headers={"If-None-Match": detail_etag}).status_code == 304
+
+    manifest_path = portal_settings.outputs_dir / "artifacts" / f"run-{run_id}-manifest.json"
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    payload["highlight_source"] = "dataset"
+    manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(manifest_path, ns=(manifest_path.stat().st_atime_ns, manifest_path.stat().st_mtime_ns + 1_000_000))
+
+    refreshed = client.get(f"/runs/{run_id}", headers={"If-None-Match": detail_etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["highlight_source"] == "dataset"
+    assert client.get("/runs", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_run_detail_etag_tracks_artifacts_outside_manifest(portal_settings: PortalSettings) -> None:
+    run_id = "20250107-000000"
+    manifest = _write_run(portal_settings.outputs_dir, run_id=run_id)
+    client = TestClient(app)
+    detail_etag = client.get(f"/runs/{run_id}").headers["etag"]
+    assert client.get(f"/runs/{run_id}", headers={"If-None-Match": detail_etag}).status_code == 304
+
+    # A later run rewrites the shared lecture path without touching this run's manifest.
+    Path(manifest["lecture"]).write_text("# Module 1\n\nRewritten by a newer run", encoding="utf-8")
+    refreshed = client.get(f"/runs/{run_id}", headers={"If-None-Match": detail_etag})
+    assert refreshed.status_code == 200
+    assert "Rewritten by a newer run" in refreshed.json()["lecture_excerpt"]
+    assert refreshed.headers["etag"] != detail_etag
+    latest = client.get("/runs/latest", headers={"If-None-Match": detail_etag})
+    assert latest.status_code == 200
+
+
+def test_read_excerpt_bounds_large_files(tmp_path: Path) -> None:
+    small = tmp_path / "small.md"
+    small.write_text("# Title\n\nShort body", encoding="utf-8")
+    assert _read_excerpt(small) == "# Title\n\nShort body"
+
+    large = tmp_path / "large.md"
+    large.write_text("# Lecture\n" + ("é" * 5000) + "\n" + ("line\n" * 1000), encoding="utf-8")
+    excerpt = _read_excerpt(large)
+    assert excerpt is not None
+    assert excerpt.startswith("# Lecture\né")
+    assert excerpt.endswith("…")
+    assert len(excerpt) <= 401
+
+
+def test_manifest_cache_reuses_parse_until_file_changes(portal_settings: PortalSettings) -> None:
+    _write_run(portal_settings.outputs_dir)
+    manifest_path = _first_manifest_path(portal_settings.outputs_dir)
+
+    first = _load_manifest(manifest_path)
+    assert _load_manifest(manifest_path) is first
+
+    payload = dict(first)
+    payload["highlight_source"] = "dataset-refresh"
+    manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    refreshed = _load_manifest(manifest_path)
+    assert refreshed is not first
+    assert refreshed["highlight_source"] == "dataset-refresh"
+
+
+def test_run_lookup_picks_up_new_manifests(portal_settings: PortalSettings) -> None:
+    _write_run(portal_settings.outputs_dir, run_id="20250107-000000")
+    client = TestClient(app)
+    assert client.get("/runs/20250107-000000/notebook-exports").status_code == 200
+    assert client.get("/runs/20250108-000000").status_code == 404
+
+    _write_run(portal_settings.outputs_dir, run_id="20250108-000000")
+    assert client.get("/runs/20250108-000000").status_code == 200
+
+
+def test_text_artifact_endpoints_return_utf8_and_404(portal_settings: PortalSettings) -> None:
+    manifest = _write_run(portal_settings.outputs_dir)
+    Path(manifest["lecture"]).write_text("# Módulo 1\n\nÍndices", encoding="utf-8")
+    client = TestClient(app)
+
+    lecture = client.get("/runs/20250101-000000/lecture")
+    assert lecture.status_code == 200
+    assert lecture.headers["content-type"].startswith("text/plain")
+    assert lecture.text == "# Módulo 1\n\nÍndices"
+
+    Path(manifest["course_plan"]).unlink()
+    missing = client.get("/runs/20250101-000000/course-plan")
+    assert missing.status_code == 404
+    assert missing.json()["detail"] == "Course plan not found for this run"
+
+
+def test_read_excerpt_missing_file_returns_none(tmp_path: Path) -> None:
+    assert _read_excerpt(None) is None
+    assert _read_excerpt(tmp_path / "missing.md") is None
+    assert _read_excerpt(tmp_path) is None
+
+
+def test_lifespan_applies_worker_thread_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _limit_inside_lifespan() -> float:
+        async with _lifespan(app):
+            return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    assert anyio.run(_limit_inside_lifespan) == get_settings().threadpool_size
+    # A cap below AnyIO's default of 40 lowers the limit instead of being ignored.
+    monkeypatch.setattr(portal_main, "SETTINGS", PortalSettings(threadpool_size=4))
+    assert anyio.run(_limit_inside_lifespan) == 4
+
+
+@pytest.mark.parametrize("raw", ["lots", "0", "-3"])
+def test_build_settings_rejects_malformed_threadpool_size(raw: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PORTAL_THREADPOOL_SIZE", raw)
+    with pytest.raises(RuntimeError, match="PORTAL_THREADPOOL_SIZE must be a positive integer"):
+        _build_settings()
+    monkeypatch.setenv("PORTAL_THREADPOOL_SIZE", "8")
+    assert _build_settings().threadpool_size == 8
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("run-20250101-000000-manifest.json", "20250101-000000"),
+        ("run-2025010a-000000-manifest.json", "run-2025010a-000000-manifest"),
+        ("run-20250101_000000-manifest.json", "run-20250101_000000-manifest"),
+        ("prefix-run-20250101-000000-manifest.json", "20250101-000000"),
+    ],
+)
+def test_extract_run_id_fast_path_matches_regex(name: str, expected: str) -> None:
+    assert _extract_run_id(Path(name)) == expected
+
+
+def test_latest_run_endpoint_picks_newest_manifest(portal_settings: PortalSettings) -> None:
+    _write_run(portal_settings.outputs_dir, run_id="20250101-000000")
+    _write_run(portal_settings.outputs_dir, run_id="20250301-000000")
+    _write_run(portal_settings.outputs_dir, run_id="20250201-000000")
+
+    client = TestClient(app)
+    latest = client.get("/runs/latest")
+    assert latest.status_code == 200
+    assert latest.json()["run_id"] == "20250301-000000"
+
+
+def test_latest_run_skips_unparseable_newest_manifest(portal_settings: PortalSettings) -> None:
+    _write_run(portal_settings.outputs_dir, run_id="20250101-000000")
+    _write_run(portal_settings.outputs_dir, run_id="20250201-000000")
+    newest = portal_settings.outputs_dir / "artifacts" / "run-20250201-000000-manifest.json"
+    newest.write_text('{"course_plan": ', encoding="utf-8")
+
+    client = TestClient(app)
+    latest = client.get("/runs/latest")
+    assert latest.status_code == 200
+    assert latest.json()["run_id"] == "20250101-000000"
+    assert client.get("/health").json()["latest_run_id"] == "20250101-000000"
+
+
+def test_runs_listing_cached_until_directory_changes(portal_settings: PortalSettings) -> None:
+    _write_run(portal_settings.outputs_dir, run_id="20250109-000000")
+    client = TestClient(app)
+    first = client.get("/runs")
+    assert [run["run_id"] for run in first.json()] == ["20250109-000000"]
+
+    manifest_path = portal_settings.outputs_dir / "artifacts" / "run-20250109-000000-manifest.json"
+    payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+    payload["highlight_source"] = "dataset"
+    manifest_path.write_text(json.dumps(payload), encoding="utf-8")
+    # In-place rewrites keep the directory mtime, so the cached listing is served until the TTL lapses.
+    assert client.get("/runs").headers["etag"] == first.headers["etag"]
+
+    _write_run(portal_settings.outputs_dir, run_id="20250110-000000")
+    refreshed = client.get("/runs").json()
+    assert [run["run_id"] for run in refreshed] == ["20250110-000000", "20250109-000000"]
+    assert refreshed[1]["highlight_source"] == "dataset"
+
+
+def test_cached_run_rows_recheck_artifact_existence(portal_settings: PortalSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(portal_main, "_RUNS_CACHE_TTL_SECONDS", 0.0)
+    manifest = _write_run(portal_settings.outputs_dir)
+    client = TestClient(app)
+    assert client.get("/runs").json()[0]["has_course_plan"] is True
+
+    Path(manifest["course_plan"]).unlink()
+    run = client.get("/runs").json()[0]
+    assert run["has_course_plan"] is False
+    assert run["has_lecture"] is True
+    assert run["overall_score"] == pytest.approx(0.92)
+
+
+def test_runs_etag_changes_when_artifact_disappears(portal_settings: PortalSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(portal_main, "_RUNS_CACHE_TTL_SECONDS", 0.0)
+    manifest = _write_run(portal_settings.outputs_dir)
+    client = TestClient(app)
+    etag = client.get("/runs").headers["etag"]
+    assert client.get("/runs", headers={"If-None-Match": etag}).status_code == 304
+
+    Path(manifest["lecture"]).unlink()
+    refreshed = client.get("/runs", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()[0]["has_lecture"] is False
+
+
+def test_cached_run_rows_recheck_world_model_store(portal_settings: PortalSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(portal_main, "_RUNS_CACHE_TTL_SECONDS", 0.0)
+    manifest = _write_run(portal_settings.outputs_dir, omit_highlight_source=True)
+    manifest_path = next((portal_settings.outputs_dir / "artifacts").glob("run-*-manifest.json"))
+    for key in ("world_model_store_exists", "world_model_highlights"):
+        manifest.pop(key)
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    client = TestClient(app)
+    run = client.get("/runs").json()[0]
+    assert run["world_model_store_exists"] is False
+    assert run["highlight_source"] == "dataset"
+
+    store_path = Path(manifest["world_model_store"])
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    store_path.write_bytes(b"")
+    run = client.get("/runs").json()[0]
+    assert run["world_model_store_exists"] is True
+    assert run["highlight_source"] == "world_model"
+
+
+def test_collect_trace_files_matches_run_id_substring(portal_settings: PortalSettings) -> None:
+    run_id = "20250111-000000"
+    manifest = _write_run(portal_settings.outputs_dir, run_id=run_id)
+    logs_dir = portal_settings.outputs_dir / "logs"
+    (logs_dir / f"codeact {run_id}.log").write_text("log", encoding="utf-8")
+    (logs_dir / f".hidden-{run_id}.log").write_text("hidden", encoding="utf-8")
+    (logs_dir / "teacher-trace-20250112-000000.json").write_text("{}", encoding="utf-8")
+    (logs_dir / f"dir-{run_id}").mkdir()
+
+    traces = {trace.name: trace for trace in collect_trace_files(run_id, manifest, portal_settings)}
+    assert traces[f"codeact_{run_id}"].path == f"logs/codeact {run_id}.log"
+    assert f"run-{run_id}-trace" in traces
+    assert not any(name.startswith(".hidden") or name.startswith("dir-") for name in traces)
+    assert "teacher-trace-20250112-000000" not in traces
+
+
+def test_artifact_endpoints_support_conditional_requests(portal_settings: PortalSettings) -> None:
+    run_id = "20250112-000000"
+    _write_run(portal_settings.outputs_dir, run_id=run_id)
+    client = TestClient(app)
+
+    lecture = client.get(f"/runs/{run_id}/lecture")
+    assert lecture.status_code == 200
+    assert lecture.headers["cache-control"] == "private, must-revalidate"
+    cached = client.get(f"/runs/{run_id}/lecture", headers={"If-None-Match": lecture.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    course_plan = client.get(f"/runs/{run_id}/course-plan")
+    last_modified = course_plan.headers["last-modified"]
+    assert client.get(f"/runs/{run_id}/course-plan", headers={"If-Modified-Since": last_modified}).status_code == 304
+    stale = client.get(
+        f"/runs/{run_id}/course-plan",
+        headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+    assert stale.status_code == 200
+    assert stale.text.startswith("# Course Plan")
+
+    detail = client.get(f"/runs/{run_id}")
+    assert detail.headers["cache-control"] == "private, must-revalidate"
+    # The detail body reads more than the manifest, so only its payload ETag is a valid validator.
+    assert "last-modified" not in detail.headers
+    trace = client.get(f"/runs/{run_id}/traces/teacher_trace")
+    assert client.get(f"/runs/{run_id}/traces/teacher_trace", headers={"If-None-Match": trace.headers["etag"]}).status_code == 304
+
+
+def test_resolve_path_still_rejects_symlinks_escaping_outputs(tmp_path: Path) -> None:
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    secret_dir = tmp_path / "secret"
+    secret_dir.mkdir()
+    (secret_dir / "notes.md").write_text("secret", encoding="utf-8")
+    (outputs / "linked").symlink_to(secret_dir, target_is_directory=True)
+    settings = PortalSettings(repo_root=tmp_path, outputs_dir=outputs, notebook_slug=None)
+
+    for _ in range(2):  # second pass exercises the memoized resolve
+        with pytest.raises(HTTPException):
+            settings.resolve_path("linked/notes.md")
+    assert settings.resolve_path("lectures/../course_plan.md") == outputs.resolve() / "course_plan.md"
+
+
+def test_trace_endpoint_streams_large_files(portal_settings: PortalSettings) -> None:
+    run_id = "20250113-000000"
+    _write_run(portal_settings.outputs_dir, run_id=run_id)
+    trace_path = portal_settings.outputs_dir / "traces" / f"run-{run_id}-trace.jsonl"
+    body = "".join(f'{{"step": {index}}}\n' for index in range(20000))
+    trace_path.write_text(body, encoding="utf-8")
+
+    client = TestClient(app)
+    response = client.get(f"/runs/{run_id}/traces/run-{run_id}-trace")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert "attachment" not in response.headers.get("content-disposition", "")
+    assert response.text == body
+
+
+def test_run_scoped_endpoints_resolve_manifest_once_per_request(portal_settings: PortalSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    run_id = "20250601-000000"
+    _write_run(portal_settings.outputs_dir, run_id=run_id)
+    calls: list[str] = []
+    original = portal_main._find_manifest_path
+
+    def counting_find(requested: str, settings: PortalSettings) -> Path:
+        calls.append(requested)
+        return original(requested, settings)
+
+    monkeypatch.setattr(portal_main, "_find_manifest_path", counting_find)
+    client = TestClient(app)
+
+    for suffix in ("course-plan", "lecture", "science-metrics", "notebook-exports"):
+        assert client.get(f"/runs/{run_id}/{suffix}").status_code == 200
+    assert calls == [run_id] * 4
+    assert client.get("/runs/19990101-000000/course-plan").status_code == 404
+
+
+def test_timestamp_for_uses_stat_mtime_in_utc(tmp_path: Path) -> None:
+    target = tmp_path / "manifest.json"
+    target.write_text("{}", encoding="utf-8")
+    os.utime(target, (1_700_000_000, 1_700_000_000))
+
+    stamp = _timestamp_for(target.stat())
+
+    assert stamp.utcoffset() is not None and stamp.utcoffset().total_seconds() == 0
+    assert stamp.timestamp() == 1_700_000_000
@@ -17,3 +17,12 @@ def test_split_fields_handles_empty_values() -> None:
     assert split_fields(None) == []
     assert split_fields("") == []
     assert split_fields([None, ""]) == []
+
+
+def test_split_fields_trims_whitespace_and_mixed_delimiters() -> None:
+    assert split_fields(" a ;b,, ; c\t") == ["a", "b", "c"]
+    assert split_fields(["x; y", 7, ["z"]]) == ["x", "y", "7", "z"]
+
+
+def test_split_fields_honours_custom_delimiters() -> None:
+    assert split_fields("a|b; c", delimiters=r"\|") == ["a", "b; c"]